@@ -13,7 +13,7 @@ async def get_prefix(bot, message: hikari.Message) -> typing.List[str]:
     if not message.guild_id:
         return [f"{bot.user.mention} ", "y."]
     else:
-        guild = await models.Guild.get(id=message.guild_id)
+        guild = await models.Guild.get_cached(message.guild_id)
         return [f"{bot.user.mention} ", guild.prefix]
 
 
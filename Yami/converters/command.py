@@ -1,19 +1,101 @@
 import typing
-from lightbulb import WrappedArg, commands, plugins
+from lightbulb import WrappedArg, commands, get_help_text, plugins
 from lightbulb.errors import ConverterFailure
 
+from Yami.utils.search import BKTree, BM25Index
+
+CommandOrPlugin = typing.Union[commands.Command, plugins.Plugin]
+
+
+class CommandIndex:
+    """Case-insensitive lookup of commands, aliases, qualified subcommand names and plugins.
+
+    Also holds a full-text index over their names, aliases, categories and help text.
+    """
+
+    def __init__(self, bot) -> None:
+        self.entries: typing.Dict[str, CommandOrPlugin] = {}
+        self.documents: typing.List[typing.Tuple[str, CommandOrPlugin]] = []
+        self.text = BM25Index()
+        self._add_commands(bot.commands, ((),))
+        for name, plugin in bot.plugins.items():
+            # Commands take precedence over plugins sharing their name.
+            self.entries.setdefault(name.casefold(), plugin)
+            self._add_document(name, plugin, get_help_text(plugin))
+        self.tree = BKTree(self.entries)
+
+    def _add_document(
+        self, name: str, obj: CommandOrPlugin, *texts: typing.Optional[str]
+    ) -> None:
+        self.text.add(len(self.documents), name, *texts)
+        self.documents.append((name, obj))
+
+    def _add_commands(
+        self,
+        cmds: typing.Iterable[commands.Command],
+        parents: typing.Tuple[typing.Tuple[str, ...], ...],
+    ) -> None:
+        for command in cmds:
+            names = [command.name, *command.aliases]
+            for parent in parents:
+                for name in names:
+                    self.entries[" ".join((*parent, name)).casefold()] = command
+            self._add_document(
+                " ".join((*parents[0], command.name)),
+                command,
+                *command.aliases,
+                command.plugin.name if command.plugin else None,
+                get_help_text(command),
+            )
+            if isinstance(command, commands.Group):
+                self._add_commands(
+                    command.subcommands,
+                    tuple((*parent, name) for parent in parents for name in names),
+                )
+
+    def get(self, name: str) -> typing.Optional[CommandOrPlugin]:
+        return self.entries.get(" ".join(name.split()).casefold())
+
+    def suggest(
+        self, name: str, *, max_distance: int = 2, limit: int = 3
+    ) -> typing.List[str]:
+        """Indexed names within `max_distance` edits of `name`, closest first."""
+        return [
+            word
+            for _, word in self.tree.search(
+                " ".join(name.split()).casefold(), max_distance
+            )[:limit]
+        ]
+
+    def search(
+        self, query: str, *, limit: int = 10
+    ) -> typing.List[typing.Tuple[str, CommandOrPlugin]]:
+        """Commands and plugins best matching the free text `query`, most relevant first."""
+        return [
+            self.documents[document_id]
+            for document_id, _ in self.text.search(query, limit=limit)
+        ]
+
+
+def get_command_index(bot) -> CommandIndex:
+    if bot.command_index is None:
+        bot.command_index = CommandIndex(bot)
+    return bot.command_index
+
+
+def did_you_mean(suggestions: typing.Sequence[str]) -> str:
+    if not suggestions:
+        return ""
+    return f" Did you mean {', '.join(f'`{name}`' for name in suggestions)}?"
+
 
 async def command_or_plugin_converter(
     arg: WrappedArg,
-) -> typing.Union[commands.Command, plugins.Plugin]:
-    try:
-        if (command := arg.context.bot.get_command(arg.data)) is not None:
-            return command
-    except KeyError:
-        pass
-    try:
-        if (plugin := arg.context.bot.get_plugin(arg.data)) is not None:
-            return plugin
-    except KeyError:
-        pass
-    raise ConverterFailure(f"Unable to get command nor plugin with name {arg}")
+) -> CommandOrPlugin:
+    index = get_command_index(arg.context.bot)
+    if (found := index.get(arg.data)) is not None:
+        return found
+    raise ConverterFailure(
+        f"Unable to get command nor plugin with name {arg}."
+        + did_you_mean(index.suggest(arg.data))
+    )
@@ -0,0 +1,103 @@
+import typing
+
+import hikari
+from lightbulb.errors import ConverterFailure
+
+from Yami.utils.cache import LRUCache
+from Yami.utils.concurrency import SingleFlight
+
+T = typing.TypeVar("T")
+_Key = typing.Tuple[str, typing.Optional[int], typing.Hashable]
+_Scope = typing.Tuple[str, typing.Optional[int]]
+
+
+class EntityFetcher:
+    """Deduplicates concurrent REST fetches made by the converters and briefly caches their results.
+
+    Lookups which found nothing are remembered for `negative_ttl` seconds, or until a gateway event
+    invalidates them, so repeated bad input never reaches REST twice. Misses are grouped by kind and
+    scope so a whole scope can be forgotten at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1000,
+        ttl: float = 30.0,
+        negative_ttl: float = 300.0,
+        negative_scope_size: int = 100,
+    ) -> None:
+        self.negative_ttl = negative_ttl
+        self.negative_scope_size = negative_scope_size
+        self.flights: SingleFlight[_Key, typing.Any] = SingleFlight()
+        self.results: LRUCache[_Key, typing.Any] = LRUCache(maxsize, ttl=ttl)
+        self.missing: LRUCache[_Scope, LRUCache[typing.Hashable, bool]] = LRUCache(
+            maxsize
+        )
+        self.negative_hits = 0
+
+    async def fetch(
+        self,
+        kind: str,
+        key: typing.Hashable,
+        factory: typing.Callable[[], typing.Awaitable[T]],
+        *,
+        scope: typing.Optional[int] = None,
+    ) -> T:
+        if self.is_missing(kind, key, scope=scope):
+            raise ConverterFailure(f"Unable to find {kind} {key}")
+        if (result := self.results.get((kind, scope, key))) is not None:
+            return result
+        try:
+            result = await self.flights.do((kind, scope, key), factory)
+        except hikari.NotFoundError:
+            self.remember_missing(kind, key, scope=scope)
+            raise ConverterFailure(f"Unable to find {kind} {key}") from None
+        if result is not None:
+            self.results.put((kind, scope, key), result)
+        return result
+
+    def is_missing(
+        self, kind: str, key: typing.Hashable, *, scope: typing.Optional[int] = None
+    ) -> bool:
+        if (misses := self.missing.get((kind, scope))) is None:
+            return False
+        if misses.get(key) is None:
+            return False
+        self.negative_hits += 1
+        return True
+
+    def remember_missing(
+        self, kind: str, key: typing.Hashable, *, scope: typing.Optional[int] = None
+    ) -> None:
+        if (misses := self.missing.get((kind, scope))) is None:
+            misses = LRUCache(self.negative_scope_size, ttl=self.negative_ttl)
+            self.missing.put((kind, scope), misses)
+        misses.put(key, True)
+
+    def invalidate(
+        self,
+        kind: str,
+        key: typing.Optional[typing.Hashable] = None,
+        *,
+        scope: typing.Optional[int] = None,
+    ) -> None:
+        """Forget the cached result and miss for `key`, or every miss in `scope` if `key` is omitted."""
+        if key is None:
+            self.missing.pop((kind, scope))
+            return
+        self.results.pop((kind, scope, key))
+        if (misses := self.missing.get((kind, scope))) is not None:
+            misses.pop(key)
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            **self.flights.stats,
+            **{f"results {key}": value for key, value in self.results.stats.items()},
+            "negative scopes": len(self.missing),
+            "negative hits": self.negative_hits,
+        }
+
+
+fetcher = EntityFetcher()
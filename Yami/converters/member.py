@@ -1,11 +1,49 @@
 # noinspection PyShadowingNames
 
+import typing
+
 import hikari
 from lightbulb import WrappedArg
 from lightbulb.errors import ConverterFailure
 
+from Yami.converters.fetch import fetcher
 from Yami.converters.reg import resolve_id_from_arg, USER_MENTION_REGEX
 
+FUZZY_MATCH_THRESHOLD: typing.Final[float] = 0.6
+
+
+def find_member_by_name(arg: WrappedArg) -> typing.Optional[hikari.Member]:
+    bot = arg.context.bot
+    if (index := bot.member_names.get(arg.context.guild_id)) is None:
+        # Guild not indexed yet, fall back to scanning the member cache.
+        return next(
+            filter(
+                lambda member: member.username == arg or member.nickname == arg,
+                bot.cache.get_members_view_for_guild(arg.context.guild_id).values(),
+            ),
+            None,
+        )
+    for case_insensitive in (False, True):
+        for member_id in sorted(index.get(arg.data, case_insensitive=case_insensitive)):
+            if (
+                member := bot.cache.get_member(arg.context.guild_id, member_id)
+            ) is not None:
+                return member
+    return None
+
+
+def search_members(
+    bot, guild_id: hikari.Snowflake, query: str, *, limit: int = 10
+) -> typing.List[typing.Tuple[hikari.Member, float]]:
+    """Fuzzy match `query` against the guild's member names, best match first."""
+    if (index := bot.member_search.get(guild_id)) is None:
+        return []
+    return [
+        (member, score)
+        for member_id, score in index.search(query, limit=limit)
+        if (member := bot.cache.get_member(guild_id, member_id)) is not None
+    ]
+
 
 # noinspection PyShadowingNames
 async def member_converter(arg: WrappedArg) -> hikari.Member:
@@ -15,17 +53,23 @@ async def member_converter(arg: WrappedArg) -> hikari.Member:
             member := arg.context.bot.cache.get_member(arg.context.guild_id, user_id)
         ) is not None:
             return member
-        return await arg.context.bot.rest.fetch_member(arg.context.guild_id, user_id)
+        return await fetcher.fetch(
+            "member",
+            user_id,
+            lambda: arg.context.bot.rest.fetch_member(arg.context.guild_id, user_id),
+            scope=arg.context.guild_id,
+        )
     else:
-        # noinspection PyProtectedMember
-        members = tuple(
-            filter(
-                lambda member: member.username == arg or member.nickname == arg,
-                arg.context.bot.cache.get_members_view_for_guild(
-                    arg.context.guild_id
-                ).values(),
+        if not fetcher.is_missing("member name", arg.data, scope=arg.context.guild_id):
+            if (member := find_member_by_name(arg)) is not None:
+                return member
+            if (
+                matches := search_members(
+                    arg.context.bot, arg.context.guild_id, arg.data, limit=1
+                )
+            ) and matches[0][1] >= FUZZY_MATCH_THRESHOLD:
+                return matches[0][0]
+            fetcher.remember_missing(
+                "member name", arg.data, scope=arg.context.guild_id
             )
-        )
-        if members:
-            return members[0]
         raise ConverterFailure(f'Unable to get member by nick/username nor id. "{arg}"')
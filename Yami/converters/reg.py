@@ -17,3 +17,34 @@ def resolve_id_from_arg(
         return hikari.Snowflake(arg_string)
     except ValueError:
         return None
+
+
+MENTION_SCANNER_REGEX: typing.Final[typing.Pattern] = re.compile(
+    r"<@!?(?P<user>\d+)>|<#(?P<channel>\d+)>|<@&(?P<role>\d+)>|(?P<snowflake>\b\d{15,21}\b)"
+)
+
+_MENTION_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "user": "users",
+    "channel": "channels",
+    "role": "roles",
+    "snowflake": "snowflakes",
+}
+
+
+class Mentions(typing.NamedTuple):
+    users: typing.Tuple[hikari.Snowflake, ...]
+    channels: typing.Tuple[hikari.Snowflake, ...]
+    roles: typing.Tuple[hikari.Snowflake, ...]
+    snowflakes: typing.Tuple[hikari.Snowflake, ...]
+
+
+def scan_mentions(text: str) -> Mentions:
+    """Extract every user, channel and role mention and raw snowflake from `text` in a single pass, deduplicated."""
+    found: typing.Dict[str, typing.Dict[hikari.Snowflake, None]] = {
+        group: {} for group in Mentions._fields
+    }
+    for match in MENTION_SCANNER_REGEX.finditer(text):
+        found[_MENTION_FIELDS[match.lastgroup]][
+            hikari.Snowflake(match.group(match.lastgroup))
+        ] = None
+    return Mentions(*(tuple(found[group]) for group in Mentions._fields))
@@ -1,25 +1,60 @@
+import typing
+
 import hikari
 from lightbulb import WrappedArg
 from lightbulb.errors import ConverterFailure
 
+from Yami.converters.fetch import fetcher
 from Yami.converters.reg import resolve_id_from_arg, USER_MENTION_REGEX
 
 
+def find_users_by_name(arg: WrappedArg) -> typing.List[hikari.User]:
+    """Every cached user matching `arg`, or `name#discriminator`, best match first."""
+    bot = arg.context.bot
+    name, _, discriminator = arg.data.partition("#")
+    if not discriminator.isdigit():
+        name, discriminator = arg.data, None
+    if not bot.user_names:
+        # Nothing indexed yet, fall back to scanning the user cache.
+        users = [
+            user
+            for user in bot.cache.get_users_view().values()
+            if user.username == name
+        ]
+    elif discriminator is not None:
+        # `search` caps its results, so filter every exact and case-insensitive match instead.
+        user_ids = dict.fromkeys(sorted(bot.user_names.get(name)))
+        user_ids.update(
+            dict.fromkeys(sorted(bot.user_names.get(name, case_insensitive=True)))
+        )
+        users = [
+            user
+            for user_id in user_ids
+            if (user := bot.cache.get_user(user_id)) is not None
+        ]
+    else:
+        users = [
+            user
+            for user_id in bot.user_names.search(name)
+            if (user := bot.cache.get_user(user_id)) is not None
+        ]
+    if discriminator is not None:
+        users = [user for user in users if user.discriminator == discriminator]
+    return users
+
+
 # noinspection PyShadowingNames
 async def user_converter(arg: WrappedArg) -> hikari.User:
     if (user_id := resolve_id_from_arg(arg.data, USER_MENTION_REGEX)) is not None:
         # noinspection PyProtectedMember
         if (user := arg.context.bot.cache.get_user(user_id)) is not None:
             return user
-        return await arg.context.bot.rest.fetch_user(user_id)
-    else:
-        # noinspection PyProtectedMember
-        users = tuple(
-            filter(
-                lambda user: user.username == arg,
-                arg.context.bot.cache.get_users_view().values(),
-            )
+        return await fetcher.fetch(
+            "user", user_id, lambda: arg.context.bot.rest.fetch_user(user_id)
         )
-        if users:
-            return users[0]
+    else:
+        if not fetcher.is_missing("user name", arg.data):
+            if users := find_users_by_name(arg):
+                return users[0]
+            fetcher.remember_missing("user name", arg.data)
         raise ConverterFailure(f'Unable to get member by username nor id. "{arg}"')
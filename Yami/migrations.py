@@ -0,0 +1,67 @@
+import logging
+import time
+import typing
+
+from tortoise import Tortoise
+from tortoise.exceptions import OperationalError
+from tortoise.transactions import in_transaction
+from tortoise.utils import generate_schema_for_client
+
+logger = logging.getLogger("Yami.migrations")
+
+# Each entry upgrades the schema by one version, statements must be safe to re-run on databases
+# which predate the schema_version table. Version 1 is the baseline created by generate_schemas.
+MIGRATIONS: typing.Final[typing.Tuple[typing.Tuple[str, ...], ...]] = (
+    (),
+    ("ALTER TABLE starredmessage ADD COLUMN IF NOT EXISTS fingerprint VARCHAR(40)",),
+    (
+        "ALTER TABLE starredmessage ADD COLUMN IF NOT EXISTS guild_id BIGINT",
+        "CREATE INDEX IF NOT EXISTS starredmessage_guild_id_idx ON starredmessage (guild_id)",
+    ),
+)
+SCHEMA_VERSION: typing.Final[int] = len(MIGRATIONS)
+
+
+async def get_schema_version() -> int:
+    try:
+        rows = await Tortoise.get_connection("default").execute_query_dict(
+            "SELECT version FROM schema_version"
+        )
+    except OperationalError:
+        return 0
+    return rows[0]["version"] if rows else 0
+
+
+async def migrate() -> int:
+    """Bring the database up to `SCHEMA_VERSION`, costing a single query when it already is."""
+    start = time.perf_counter()
+    if (version := await get_schema_version()) == SCHEMA_VERSION:
+        return version
+    if version > SCHEMA_VERSION:
+        logger.warning(
+            "Database schema version %s is newer than %s, skipping migrations.",
+            version,
+            SCHEMA_VERSION,
+        )
+        return version
+
+    async with in_transaction() as connection:
+        if version == 0:
+            await generate_schema_for_client(connection, safe=True)
+            await connection.execute_script(
+                "CREATE TABLE IF NOT EXISTS schema_version (version INT NOT NULL)"
+            )
+        for statements in MIGRATIONS[version:]:
+            for statement in statements:
+                await connection.execute_script(statement)
+        await connection.execute_script("DELETE FROM schema_version")
+        await connection.execute_query(
+            "INSERT INTO schema_version (version) VALUES ($1)", [SCHEMA_VERSION]
+        )
+    logger.info(
+        "Migrated database schema from version %s to %s in %.2fms",
+        version,
+        SCHEMA_VERSION,
+        (time.perf_counter() - start) * 1000,
+    )
+    return SCHEMA_VERSION
@@ -1,11 +1,18 @@
 from tortoise import fields
 from tortoise.models import Model
 
+from Yami.utils.cache import LRUCache
+
+guild_cache: LRUCache[int, "Guild"] = LRUCache(maxsize=10_000, ttl=60 * 60)
+
 
 class StarredMessage(Model):
     id = fields.BigIntField(unique=True, pk=True)
     star_id = fields.BigIntField(unique=True)
     stars = fields.IntField()
+    fingerprint = fields.CharField(max_length=40, null=True)
+    # Indexed by Yami.migrations
+    guild_id = fields.BigIntField(null=True)
 
 
 class Guild(Model):
@@ -13,3 +20,18 @@ class Guild(Model):
     prefix = fields.TextField(default="y.")
     starboard = fields.BigIntField(null=True, default=None)
     stars = fields.IntField(default=3)
+
+    @classmethod
+    async def get_cached(cls, guild_id: int) -> "Guild":
+        if (guild := guild_cache.get(guild_id)) is None:
+            guild, _ = await cls.get_or_create(id=guild_id)
+            guild_cache.put(guild.id, guild)
+        return guild
+
+    async def save(self, *args, **kwargs) -> None:
+        await super().save(*args, **kwargs)
+        guild_cache.put(self.id, self)
+
+    async def delete(self, *args, **kwargs) -> None:
+        await super().delete(*args, **kwargs)
+        guild_cache.pop(self.id)
@@ -23,7 +23,7 @@ class Admin(Plugin):
     @guild_only()
     @settings.command(name="starboard", aliases=["sb"])
     async def get_starboard(self, context: Context):
-        guild = await models.Guild.get(id=context.guild_id)
+        guild = await models.Guild.get_cached(context.guild_id)
         await context.reply(
             f"Starboard is currently set to {f'<#{guild.starboard}>' if guild.starboard else None}."
         )
@@ -35,7 +35,7 @@ class Admin(Plugin):
         self, context: Context, channel: text_channel_converter = None
     ):
         channel: GuildTextChannel = channel
-        guild = await models.Guild.get(id=context.guild_id)
+        guild = await models.Guild.get_cached(context.guild_id)
         guild.starboard = channel.id if channel else None
         await guild.save()
         await context.reply(
@@ -46,7 +46,7 @@ class Admin(Plugin):
     @guild_only()
     @settings.command(name="stars", aliases=["s"])
     async def get_stars(self, context: Context):
-        guild = await models.Guild.get(id=context.guild_id)
+        guild = await models.Guild.get_cached(context.guild_id)
         await context.reply(
             f"{guild.stars} is the amount of stars required for messages to be sent in starboard."
         )
@@ -59,7 +59,7 @@ class Admin(Plugin):
             return await context.reply(
                 f"Can't set stars to {stars}, number must be between 1 and 20"
             )
-        guild = await models.Guild.get(id=context.guild_id)
+        guild = await models.Guild.get_cached(context.guild_id)
         guild.stars = stars
         await guild.save()
         await context.reply(
@@ -71,7 +71,7 @@ class Admin(Plugin):
     @guild_only()
     @settings.command(name="setprefix", aliases=["sp"])
     async def set_prefix(self, context: Context, prefix):
-        guild = await models.Guild.get(id=context.guild_id)
+        guild = await models.Guild.get_cached(context.guild_id)
         guild.prefix = prefix
         await guild.save()
         await context.reply(f"Prefix successfully set to `{prefix}`.")
@@ -1,38 +1,134 @@
+import asyncio
+import os
+import time
 import typing
 from datetime import datetime, timezone
 
 import hikari
 from hikari import (
     GuildAvailableEvent,
+    GuildMessageBulkDeleteEvent,
+    MessageDeleteEvent,
+    MessageUpdateEvent,
     NotFoundError,
     ShardReadyEvent,
     StartingEvent,
     GuildReactionAddEvent,
     GuildReactionDeleteEvent,
+    GuildReactionDeleteAllEvent,
+    GuildReactionDeleteEmojiEvent,
 )
 from lightbulb import plugins
 
 from Yami import models
 from Yami.subclasses.bot import Bot
 from Yami.subclasses.plugin import Plugin
+from Yami.utils.cache import LRUCache
+from Yami.utils.concurrency import Batcher, Debouncer, KeyedLock
+from Yami.utils.starboard import (
+    StarCounter,
+    approximate_message_size,
+    render_fingerprint,
+)
+
+StarEvent = typing.Union[
+    GuildReactionAddEvent,
+    GuildReactionDeleteEvent,
+    GuildReactionDeleteAllEvent,
+    GuildReactionDeleteEmojiEvent,
+]
 
 
 class Events(Plugin):
     def __init__(self, bot: Bot):
         super(Events, self).__init__(bot)
+        self.guild_batcher: Batcher[int] = Batcher(self.bootstrap_guilds, window=2.0)
+        self.bootstrap_stats: typing.Dict[str, typing.Any] = {}
+        self.starboard_debouncer: Debouncer[hikari.Snowflake, StarEvent] = Debouncer(
+            self.update_starboard, delay=2.0, max_delay=10.0
+        )
+        self.star_counter = StarCounter()
+        self.reconcile_interval = 300.0
+        self.reconciler: typing.Optional[asyncio.Task] = None
+        self.starboard_locks: KeyedLock[int] = KeyedLock()
+        self.suppressed_edits = 0
+        self.message_cache: LRUCache[typing.Tuple[int, int], hikari.Message] = LRUCache(
+            int(os.getenv("YAMI_MESSAGE_CACHE_SIZE", 1000)),
+            sizeof=approximate_message_size,
+            max_bytes=int(os.getenv("YAMI_MESSAGE_CACHE_BYTES", 8 * 1024 * 1024)),
+        )
+        self.bot.stats_providers["Guild bootstrap"] = self.get_bootstrap_stats
+        self.bot.stats_providers["Starboard"] = self.get_starboard_stats
+
+    def plugin_remove(self):
+        self.guild_batcher.cancel()
+        self.starboard_debouncer.cancel()
+        if self.reconciler is not None:
+            self.reconciler.cancel()
+        self.bot.stats_providers.pop("Guild bootstrap", None)
+        self.bot.stats_providers.pop("Starboard", None)
 
     # noinspection PyUnusedLocal
     @plugins.listener()
     async def on_starting(self, event: StartingEvent):
         await self.bot.initialize_database()
+        self.reconciler = asyncio.create_task(self.reconcile_star_counts())
 
     @plugins.listener()
     async def on_ready(self, event: ShardReadyEvent):
         self.bot.user = event.my_user
+        guild_ids = event.unavailable_guilds
+        inserted, elapsed = await self.bootstrap_guilds(guild_ids)
+        shard = f"Shard {event.shard.id}"
+        self.bootstrap_stats.update(
+            {
+                shard: f"{len(guild_ids)} guilds in {elapsed * 1000:.2f}ms",
+                f"{shard} inserted": inserted,
+            }
+        )
 
     @plugins.listener()
     async def on_guild_join(self, event: GuildAvailableEvent):
-        await models.Guild.get_or_create(id=event.guild.id)
+        if event.guild.id not in models.guild_cache:
+            self.guild_batcher.add(event.guild.id)
+
+    async def bootstrap_guilds(
+        self, guild_ids: typing.Iterable[int]
+    ) -> typing.Tuple[int, float]:
+        """Load the settings of `guild_ids` into the guild cache, creating missing rows in bulk."""
+        start = time.perf_counter()
+        guild_ids = set(guild_ids)
+        if not guild_ids:
+            return 0, 0.0
+        existing = await models.Guild.filter(id__in=guild_ids)
+        for guild in existing:
+            models.guild_cache.put(guild.id, guild)
+        missing = [
+            models.Guild(id=guild_id)
+            for guild_id in guild_ids - {guild.id for guild in existing}
+        ]
+        if missing:
+            await models.Guild.bulk_create(missing)
+            for guild in missing:
+                # noinspection PyProtectedMember
+                guild._saved_in_db = True
+                models.guild_cache.put(guild.id, guild)
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            "Bootstrapped %s guilds (%s inserted) in %.2fms",
+            len(guild_ids),
+            len(missing),
+            elapsed * 1000,
+        )
+        return len(missing), elapsed
+
+    def get_bootstrap_stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            **self.bootstrap_stats,
+            "Late joins batched": self.guild_batcher.items,
+            "Late join batches": self.guild_batcher.batches,
+            "Pending": len(self.guild_batcher),
+        }
 
     @staticmethod
     async def get_starboard_embed(
@@ -60,61 +156,164 @@ class Events(Plugin):
 
         return embed, f"⭐ {stars} <#{channel.id}>"
 
+    @staticmethod
+    def get_starboard_fingerprint(
+        message: hikari.Message, embed: hikari.Embed, content: str
+    ) -> str:
+        return render_fingerprint(
+            content,
+            embed.description,
+            embed.footer.text,
+            message.author.username,
+            message.author.avatar_url,
+            message.attachments[0].url if message.attachments else None,
+        )
+
+    async def fetch_message(
+        self, channel_id: hikari.Snowflakeish, message_id: hikari.Snowflakeish
+    ) -> hikari.Message:
+        key = (int(channel_id), int(message_id))
+        if (message := self.message_cache.get(key)) is None:
+            message = await self.bot.rest.fetch_message(channel_id, message_id)
+            self.message_cache.put(key, message)
+        return message
+
+    @plugins.listener()
+    async def on_message_update(self, event: MessageUpdateEvent):
+        self.message_cache.pop((event.message.channel_id, event.message.id))
+
+    @plugins.listener()
+    async def on_message_delete(self, event: MessageDeleteEvent):
+        self.message_cache.pop((event.message.channel_id, event.message.id))
+
+    @plugins.listener()
+    async def on_message_bulk_delete(self, event: GuildMessageBulkDeleteEvent):
+        for message_id in event.message_ids:
+            self.message_cache.pop((event.channel_id, message_id))
+
     @plugins.listener()
     async def on_reaction_add(self, event: GuildReactionAddEvent):
-        guild, _ = await models.Guild.get_or_create(id=event.guild_id)
+        guild = await models.Guild.get_cached(event.guild_id)
         if not guild.starboard or not event.emoji == "⭐":
             return
+        self.star_counter.add(event.message_id, 1)
+        self.starboard_debouncer.schedule(event.message_id, event)
 
-        # noinspection PyTypeChecker
-        starboard: hikari.GuildTextChannel = self.bot.cache.get_guild_channel(
-            guild.starboard
-        ) or await self.bot.rest.fetch_channel(guild.starboard)
+    @plugins.listener()
+    async def on_reaction_remove(self, event: GuildReactionDeleteEvent):
+        guild = await models.Guild.get_cached(event.guild_id)
+        if not guild.starboard or not event.emoji == "⭐":
+            return
+        self.star_counter.add(event.message_id, -1)
+        self.starboard_debouncer.schedule(event.message_id, event)
 
-        message = await self.bot.rest.fetch_message(event.channel_id, event.message_id)
+    @plugins.listener()
+    async def on_reaction_remove_all(self, event: GuildReactionDeleteAllEvent):
+        guild = await models.Guild.get_cached(event.guild_id)
+        if not guild.starboard:
+            return
+        self.star_counter.set(event.message_id, 0)
+        self.starboard_debouncer.schedule(event.message_id, event)
 
-        if (
-            message.author.id == event.user_id
-            or message.author.id == self.bot.user.id
-            or event.member.is_bot
-        ):
-            return await message.remove_reaction(emoji="⭐", user=message.author)
+    @plugins.listener()
+    async def on_reaction_remove_emoji(self, event: GuildReactionDeleteEmojiEvent):
+        guild = await models.Guild.get_cached(event.guild_id)
+        if not guild.starboard or not event.emoji == "⭐":
+            return
+        self.star_counter.set(event.message_id, 0)
+        self.starboard_debouncer.schedule(event.message_id, event)
+
+    async def update_starboard(
+        self, message_id: hikari.Snowflake, events: typing.List[StarEvent]
+    ):
+        """Recount and repost a starred message once per burst of star reactions."""
+        event = events[-1]
+        message = await self.fetch_message(event.channel_id, message_id)
+
+        invalid_users = {
+            e.user_id
+            for e in events
+            if isinstance(e, GuildReactionAddEvent)
+            and (e.user_id == message.author.id or (e.member and e.member.is_bot))
+        }
+        if invalid_users or message.author.id == self.bot.user.id:
+            # Removing these reactions dispatches delete events which schedule the recount.
+            for user_id in invalid_users:
+                await message.remove_reaction(emoji="⭐", user=user_id)
+            return
 
-        starred_message_model = await models.StarredMessage.get_or_none(
-            id=event.message_id
-        )
+        await self.refresh_starboard(event.guild_id, message)
 
-        stars = await self.bot.rest.fetch_reactions_for_emoji(
-            event.channel_id, event.message_id, "⭐"
-        ).count()
+    async def refresh_starboard(
+        self, guild_id: hikari.Snowflake, message: hikari.Message
+    ):
+        guild = await models.Guild.get_cached(guild_id)
+        if not guild.starboard:
+            return
 
-        if starred_message_model:
-            try:
-                starred_message = await self.bot.rest.fetch_message(
-                    starboard, starred_message_model.star_id
+        async with self.starboard_locks(message.id):
+            if (stars := self.star_counter.get(message.id)) is None:
+                stars = next(
+                    (
+                        reaction.count
+                        for reaction in message.reactions
+                        if reaction.emoji == "⭐"
+                    ),
+                    0,
                 )
-            except NotFoundError:
-                await starred_message_model.delete()
-                return
+                self.star_counter.set(message.id, stars)
+            self.star_counter.mark(message.id, guild_id, message.channel_id)
 
             # noinspection PyTypeChecker
-            embed, content = await self.get_starboard_embed(
-                message=message,
-                guild_id=guild.id,
-                created_at=starred_message.created_at,
-                stars=stars,
-                channel=self.bot.cache.get_guild_channel(message.channel_id)
-                or await message.fetch_channel(),
-            )
+            starboard: hikari.GuildTextChannel = self.bot.cache.get_guild_channel(
+                guild.starboard
+            ) or await self.bot.rest.fetch_channel(guild.starboard)
 
-            starred_message_model.stars = stars
-            await starred_message_model.save()
+            starred_message_model = await models.StarredMessage.get_or_none(
+                id=message.id
+            )
 
-            await starred_message.edit(embed=embed, content=content)
+            if starred_message_model:
+                # noinspection PyTypeChecker
+                embed, content = await self.get_starboard_embed(
+                    message=message,
+                    guild_id=guild.id,
+                    created_at=hikari.Snowflake(
+                        starred_message_model.star_id
+                    ).created_at,
+                    stars=stars,
+                    channel=self.bot.cache.get_guild_channel(message.channel_id)
+                    or await message.fetch_channel(),
+                )
+                fingerprint = self.get_starboard_fingerprint(message, embed, content)
+                if fingerprint == starred_message_model.fingerprint:
+                    self.suppressed_edits += 1
+                    return
+
+                try:
+                    starred_message = await self.fetch_message(
+                        starboard.id, starred_message_model.star_id
+                    )
+                    starred_message = await starred_message.edit(
+                        embed=embed, content=content
+                    )
+                except NotFoundError:
+                    # The copy may still be cached after a missed delete event.
+                    self.message_cache.pop(
+                        (starboard.id, starred_message_model.star_id)
+                    )
+                    await starred_message_model.delete()
+                    return
+
+                self.message_cache.put(
+                    (starboard.id, starred_message.id), starred_message
+                )
 
-        else:
+                starred_message_model.stars = stars
+                starred_message_model.fingerprint = fingerprint
+                await starred_message_model.save()
 
-            if stars >= guild.stars:
+            elif stars >= guild.stars:
                 # noinspection PyTypeChecker
                 embed, content = await self.get_starboard_embed(
                     message=message,
@@ -126,57 +325,60 @@ class Events(Plugin):
                 )
 
                 starred_message = await starboard.send(embed=embed, content=content)
+                self.message_cache.put(
+                    (starboard.id, starred_message.id), starred_message
+                )
 
                 await models.StarredMessage.create(
-                    id=message.id, star_id=starred_message.id, stars=stars
+                    id=message.id,
+                    star_id=starred_message.id,
+                    guild_id=guild.id,
+                    stars=stars,
+                    fingerprint=self.get_starboard_fingerprint(message, embed, content),
                 )
 
-    @plugins.listener()
-    async def on_reaction_remove(self, event: GuildReactionDeleteEvent):
-        guild, _ = await models.Guild.get_or_create(id=event.guild_id)
-
-        if not guild.starboard or not event.emoji == "⭐":
-            return
-
-        # noinspection PyTypeChecker
-        starboard: hikari.GuildTextChannel = await self.bot.rest.fetch_channel(
-            guild.starboard
-        )
-
-        message = await self.bot.rest.fetch_message(event.channel_id, event.message_id)
-
-        if event.user_id == message.author.id:
-            return
-
-        starred_message_model = await models.StarredMessage.get_or_none(
-            id=event.message_id
-        )
-
-        stars = await self.bot.rest.fetch_reactions_for_emoji(
-            event.channel_id, event.message_id, "⭐"
-        ).count()
-
-        if starred_message_model and stars > starred_message_model.stars:
-
-            try:
-                starred_message = await self.bot.rest.fetch_message(
-                    starboard, starred_message_model.star_id
-                )
-            except NotFoundError:
-                await starred_message_model.delete()
-                return
-            # noinspection PyTypeChecker
-            embed, content = await self.get_starboard_embed(
-                message=message,
-                guild_id=guild.id,
-                created_at=starred_message.created_at,
-                stars=stars,
-                channel=self.bot.cache.get_guild_channel(message.channel_id)
-                or await message.fetch_channel(),
-            )
-            starred_message_model.stars = stars
-            await starred_message_model.save()
-            await starred_message.edit(embed=embed, content=content)
+    async def reconcile_star_counts(self):
+        """Periodically re-check event maintained star counts against REST, one message at a time."""
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            for message_id, (guild_id, channel_id) in self.star_counter.drain():
+                # noinspection PyBroadException
+                try:
+                    stars = await self.bot.rest.fetch_reactions_for_emoji(
+                        channel_id, message_id, "⭐"
+                    ).count()
+                    if stars != self.star_counter.get(message_id):
+                        self.star_counter.corrections += 1
+                        self.star_counter.set(message_id, stars)
+                        await self.refresh_starboard(
+                            guild_id, await self.fetch_message(channel_id, message_id)
+                        )
+                except NotFoundError:
+                    self.star_counter.pop(message_id)
+                except Exception:
+                    self.logger.exception("Failed to reconcile stars of %s", message_id)
+                await asyncio.sleep(1)
+
+    def get_starboard_stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "Reaction events": self.starboard_debouncer.received,
+            "Updates": self.starboard_debouncer.calls,
+            "Merged events": self.starboard_debouncer.merged,
+            "Pending messages": len(self.starboard_debouncer),
+            "Suppressed edits": self.suppressed_edits,
+            **{
+                f"Star counts {key}": value
+                for key, value in self.star_counter.stats.items()
+            },
+            **{
+                f"Locks {key}": value
+                for key, value in self.starboard_locks.stats.items()
+            },
+            **{
+                f"Message cache {key}": value
+                for key, value in self.message_cache.stats.items()
+            },
+        }
 
 
 def load(bot):
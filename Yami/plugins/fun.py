@@ -1,10 +1,19 @@
-import io
+import asyncio
+import os
+import typing
 
 import aiohttp
+import hikari
 from lightbulb import Context, commands
 
 from Yami.subclasses.bot import Bot
 from Yami.subclasses.plugin import Plugin
+from Yami.utils.cache import LRUCache
+from Yami.utils.concurrency import first_preferred
+from Yami.utils.media import CachedMedia, MediaCache
+
+# Best first; YouTube only has `hqdefault` for some videos.
+THUMBNAIL_QUALITIES: typing.Final[typing.Tuple[str, ...]] = ("hqdefault", "default")
 
 
 def get_video_id(query: str) -> str:
@@ -27,35 +36,58 @@ def get_video_id(query: str) -> str:
 class Fun(Plugin):
     def __init__(self, bot: Bot):
         super().__init__(bot)
+        self.thumbnails = MediaCache(
+            max_bytes=int(os.getenv("YAMI_THUMBNAIL_CACHE_BYTES", 16 * 1024 * 1024)),
+            spill_dir=os.getenv("YAMI_THUMBNAIL_SPILL_DIR"),
+        )
+        self.thumbnail_variants: LRUCache[str, str] = LRUCache(10_000)
+        self.bot.stats_providers["Thumbnail cache"] = lambda: self.thumbnails.stats
+
+    def plugin_remove(self):
+        self.bot.stats_providers.pop("Thumbnail cache", None)
 
     @commands.command()
     async def thumbnail(self, context: Context, query):
 
         video_id = get_video_id(query)
 
-        async with aiohttp.request(
-            "get", f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-        ) as resp:
-            if resp.status == 404:
-                async with aiohttp.request(
-                    "get", f"https://img.youtube.com/vi/{video_id}/default.jpg"
-                ) as resp_:
-                    if resp_.status == 404:
-                        return await context.reply("Invalid Youtube video.")
-                    elif resp_.status == 200:
-                        bio = io.BytesIO()
-                        bio.write(await resp_.read())
-                        bio.seek(0)
-                        return await context.reply(bio.read())
-                    else:
-                        await context.reply("Unknown error occurred.")
-            elif resp.status == 200:
-                bio = io.BytesIO()
-                bio.write(await resp.read())
-                bio.seek(0)
-                return await context.reply(bio.read())
-            else:
-                await context.reply("Unknown error occurred.")
+        # Remembered variants skip straight to the URL known to exist.
+        qualities = (
+            (known,)
+            if (known := self.thumbnail_variants.get(video_id)) is not None
+            else THUMBNAIL_QUALITIES
+        )
+        missing: typing.Set[str] = set()
+        try:
+            found = await first_preferred(
+                *(
+                    self.fetch_thumbnail(video_id, quality, missing)
+                    for quality in qualities
+                )
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return await context.reply("Unknown error occurred.")
+        if found is None:
+            self.thumbnail_variants.pop(video_id)
+            return await context.reply("Invalid Youtube video.")
+        quality, media = found
+        # Only pin a variant once every better one is known not to exist, not after a transient error.
+        if missing.issuperset(qualities[: qualities.index(quality)]):
+            self.thumbnail_variants.put(video_id, quality)
+        await context.reply(attachment=hikari.Bytes(media.data, f"{video_id}.jpg"))
+
+    async def fetch_thumbnail(
+        self, video_id: str, quality: str, missing: typing.Set[str]
+    ) -> typing.Optional[typing.Tuple[str, CachedMedia]]:
+        media = await self.thumbnails.fetch(
+            self.bot.http_client,
+            (video_id, quality),
+            f"https://img.youtube.com/vi/{video_id}/{quality}.jpg",
+        )
+        if media is None:
+            missing.add(quality)
+            return None
+        return quality, media
 
 
 def load(bot):
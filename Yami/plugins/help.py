@@ -15,13 +15,105 @@ from lightbulb import (
 )
 from lightbulb.utils import EmbedNavigator, EmbedPaginator
 
+from Yami.converters.command import (
+    CommandIndex,
+    CommandOrPlugin,
+    did_you_mean,
+    get_command_index,
+)
 from Yami.subclasses.plugin import Plugin
+from Yami.utils.cache import LRUCache
+from Yami.utils.roles import get_role_hierarchy
 from Yami.utils.text import ctx_name
 
 
+_RenderKey = typing.Tuple[bool, bool, int]
+
+
 class MyHelpCommand(HelpCommand):
+    def __init__(self, bot):
+        super().__init__(bot)
+        # Overview lines depend only on which checks pass, so they are shared by every
+        # requester with the same owner status, guild or DM context and permissions.
+        self.render_cache: LRUCache[_RenderKey, typing.List[str]] = LRUCache(256)
+        self._rendered_for: typing.Optional[CommandIndex] = None
+
+    async def get_render_key(self, context: Context) -> _RenderKey:
+        if not self.bot.owner_ids:
+            await self.bot.fetch_owner_ids()
+        permissions = 0
+        if context.guild_id is not None:
+            hierarchy = await get_role_hierarchy(self.bot, context.guild_id)
+            for role in hierarchy.sorted_roles(
+                [context.guild_id, *context.member.role_ids]
+            ):
+                permissions |= int(role.permissions)
+        return (
+            context.author.id in self.bot.owner_ids,
+            context.guild_id is not None,
+            permissions,
+        )
+
+    async def resolve_help_obj(
+        self, context: Context, obj: typing.Union[str, typing.Sequence[str]]
+    ) -> None:
+        name = obj if isinstance(obj, str) else " ".join(obj)
+        if not name:
+            return await self.send_help_overview(context)
+        index = get_command_index(self.bot)
+        found = index.get(name)
+        keyword, _, query = name.partition(" ")
+        if found is None and keyword.casefold() == "search" and query.strip():
+            await self.send_search_results(context, query, index.search(query))
+        elif isinstance(found, Group):
+            await self.send_group_help(context, found)
+        elif isinstance(found, Command):
+            await self.send_command_help(context, found)
+        elif isinstance(found, plugins.Plugin):
+            await self.send_plugin_help(context, found)
+        else:
+            await self.object_not_found(context, name)
+
+    async def object_not_found(self, context: Context, name: str) -> None:
+        await context.reply(
+            f"`{name}` is not a valid command, group or category."
+            + did_you_mean(get_command_index(self.bot).suggest(name))
+        )
+
+    async def send_search_results(
+        self,
+        context: Context,
+        query: str,
+        results: typing.Sequence[typing.Tuple[str, CommandOrPlugin]],
+    ) -> None:
+        lines = []
+        for name, obj in results:
+            summary = (get_help_text(obj) or "No help available.").splitlines()[0]
+            kind = "Category" if isinstance(obj, plugins.Plugin) else "Command"
+            lines.append(f"**{kind}** `{name}`: {summary}")
+        await context.reply(
+            embed=hikari.Embed(
+                title=f"Help search for `{query}`",
+                description="\n".join(lines) or "No commands or categories matched.",
+                colour=random.randint(0, 0xFFFFFF),
+                timestamp=datetime.now(tz=timezone.utc),
+            ).set_footer(
+                text=f"Requested by {ctx_name(context)}", icon=context.author.avatar_url
+            )
+        )
+
     async def send_help_overview(self, context: Context) -> None:
+        # The command index is rebuilt whenever plugins or commands are added or removed.
+        if (index := get_command_index(self.bot)) is not self._rendered_for:
+            self.render_cache.clear()
+            self._rendered_for = index
+        key = await self.get_render_key(context)
+        if (help_text := self.render_cache.get(key)) is None:
+            help_text = await self.render_help_overview(context)
+            self.render_cache.put(key, help_text)
+        await self.send_paginated_help(help_text, context)
 
+    async def render_help_overview(self, context: Context) -> typing.List[str]:
         plugin_commands = [
             [
                 plugin.name,
@@ -48,7 +140,7 @@ class MyHelpCommand(HelpCommand):
                 )
             )
             help_text.append(f"{text}.")
-        await self.send_paginated_help(help_text, context)
+        return help_text
 
     @staticmethod
     async def send_paginated_help(text: typing.Sequence[str], context: Context) -> None:
@@ -60,7 +152,8 @@ class MyHelpCommand(HelpCommand):
             return (
                 hikari.Embed(
                     title="Help",
-                    description=f"Use `{context.prefix}help [command/cog]` for more detailed info.",
+                    description=f"Use `{context.prefix}help [command/cog]` for more detailed info, "
+                    f"or `{context.prefix}help search <terms>` to search commands.",
                     colour=random.randint(0, 0xFFFFFF),
                     timestamp=datetime.now(tz=timezone.utc),
                 )
@@ -178,11 +271,15 @@ class Help(Plugin):
     def __init__(self, bot):
         super().__init__(bot)
         self._original_help_command = bot._help_impl
-        bot._help_impl = MyHelpCommand(bot)
+        self.help_command = bot._help_impl = MyHelpCommand(bot)
         self.bot.get_command("help").plugin = self.bot.get_plugin("info")
+        self.bot.stats_providers[
+            "Help overview cache"
+        ] = lambda: self.help_command.render_cache.stats
 
     def plugin_remove(self):
         self.bot._help_impl = self._original_help_command
+        self.bot.stats_providers.pop("Help overview cache", None)
 
 
 def load(bot):
@@ -0,0 +1,178 @@
+import hikari
+from hikari import (
+    EmojisUpdateEvent,
+    GuildAvailableEvent,
+    GuildChannelCreateEvent,
+    GuildChannelDeleteEvent,
+    GuildLeaveEvent,
+    GuildUpdateEvent,
+    MemberChunkEvent,
+    MemberCreateEvent,
+    MemberDeleteEvent,
+    MemberUpdateEvent,
+    OwnUserUpdateEvent,
+    RoleCreateEvent,
+    RoleDeleteEvent,
+    RoleUpdateEvent,
+)
+from lightbulb import plugins
+
+from Yami.converters.fetch import fetcher
+from Yami.subclasses.bot import Bot
+from Yami.subclasses.plugin import Plugin
+from Yami.utils.guild_stats import GuildStats
+from Yami.utils.names import NameIndex
+from Yami.utils.search import TrigramIndex
+
+
+class Indexes(Plugin):
+    """Keeps the bot's lookup indexes in sync with the gateway."""
+
+    def __init__(self, bot: Bot):
+        super().__init__(bot)
+        self.bot.stats_providers["Indexes"] = self.get_index_stats
+
+    def plugin_remove(self):
+        self.bot.member_names.clear()
+        self.bot.member_search.clear()
+        self.bot.guild_stats.clear()
+        self.bot.role_hierarchies.clear()
+        self.bot.user_names = NameIndex(prefix_search=True)
+        self.bot.stats_providers.pop("Indexes", None)
+
+    def index_member(self, guild_id: hikari.Snowflake, member: hikari.Member):
+        self.bot.user_names.add(member.id, member.username)
+        if (names := self.bot.member_names.get(guild_id)) is not None:
+            names.add(member.id, member.username, member.nickname)
+        if (search := self.bot.member_search.get(guild_id)) is not None:
+            search.add(
+                member.id,
+                member.username,
+                member.nickname,
+                f"{member.username}#{member.discriminator}",
+            )
+
+    @staticmethod
+    def invalidate_name_misses(guild_id: hikari.Snowflake):
+        fetcher.invalidate("member name", scope=guild_id)
+        fetcher.invalidate("user name")
+
+    def track_guild(self, event: GuildAvailableEvent):
+        self.bot.guild_stats[event.guild.id] = GuildStats.from_views(
+            event.members.values(),
+            event.channels.values(),
+            event.roles.values(),
+            event.emojis.values(),
+        )
+
+    @plugins.listener()
+    async def on_guild_available(self, event: GuildAvailableEvent):
+        fetcher.invalidate("guild", event.guild.id)
+        self.track_guild(event)
+        self.bot.member_names[event.guild.id] = NameIndex()
+        self.bot.member_search[event.guild.id] = TrigramIndex()
+        for member in event.members.values():
+            self.index_member(event.guild.id, member)
+        self.invalidate_name_misses(event.guild.id)
+
+    @plugins.listener()
+    async def on_member_chunk(self, event: MemberChunkEvent):
+        # Large guilds only send part of their members on availability, the rest arrive in chunks.
+        for member in event.members.values():
+            self.index_member(event.guild_id, member)
+        self.invalidate_name_misses(event.guild_id)
+        # Recount from the cache once every chunk is in, rather than risk counting a member twice.
+        if (
+            event.index == event.count - 1
+            and (stats := self.bot.guild_stats.get(event.guild_id)) is not None
+        ):
+            stats.count_members(
+                self.bot.cache.get_members_view_for_guild(event.guild_id).values()
+            )
+
+    @plugins.listener()
+    async def on_guild_update(self, event: GuildUpdateEvent):
+        self.bot.role_hierarchies.pop(event.guild.id, None)
+        if (stats := self.bot.guild_stats.get(event.guild.id)) is not None:
+            stats.roles = len(event.roles)
+            stats.emojis = len(event.emojis)
+
+    @plugins.listener()
+    async def on_guild_channel_create(self, event: GuildChannelCreateEvent):
+        fetcher.invalidate("channel", event.channel.id)
+        if (stats := self.bot.guild_stats.get(event.channel.guild_id)) is not None:
+            stats.add_channel(event.channel.type)
+
+    @plugins.listener()
+    async def on_guild_channel_delete(self, event: GuildChannelDeleteEvent):
+        if (stats := self.bot.guild_stats.get(event.channel.guild_id)) is not None:
+            stats.remove_channel(event.channel.type)
+
+    @plugins.listener()
+    async def on_role_create(self, event: RoleCreateEvent):
+        self.bot.role_hierarchies.pop(event.guild_id, None)
+        if (stats := self.bot.guild_stats.get(event.guild_id)) is not None:
+            stats.roles += 1
+
+    @plugins.listener()
+    async def on_role_update(self, event: RoleUpdateEvent):
+        self.bot.role_hierarchies.pop(event.guild_id, None)
+
+    @plugins.listener()
+    async def on_role_delete(self, event: RoleDeleteEvent):
+        self.bot.role_hierarchies.pop(event.guild_id, None)
+        if (stats := self.bot.guild_stats.get(event.guild_id)) is not None:
+            stats.roles = max(stats.roles - 1, 0)
+
+    @plugins.listener()
+    async def on_emojis_update(self, event: EmojisUpdateEvent):
+        if (stats := self.bot.guild_stats.get(event.guild_id)) is not None:
+            stats.emojis = len(event.emojis)
+
+    @plugins.listener()
+    async def on_guild_leave(self, event: GuildLeaveEvent):
+        self.bot.member_names.pop(event.guild_id, None)
+        self.bot.member_search.pop(event.guild_id, None)
+        self.bot.guild_stats.pop(event.guild_id, None)
+        self.bot.role_hierarchies.pop(event.guild_id, None)
+
+    @plugins.listener()
+    async def on_member_create(self, event: MemberCreateEvent):
+        fetcher.invalidate("member", event.member.id, scope=event.guild_id)
+        fetcher.invalidate("user", event.member.id)
+        self.index_member(event.guild_id, event.member)
+        self.invalidate_name_misses(event.guild_id)
+        if (stats := self.bot.guild_stats.get(event.guild_id)) is not None:
+            stats.add_member(event.member.is_bot)
+
+    @plugins.listener()
+    async def on_member_update(self, event: MemberUpdateEvent):
+        self.index_member(event.member.guild_id, event.member)
+        self.invalidate_name_misses(event.member.guild_id)
+
+    @plugins.listener()
+    async def on_member_delete(self, event: MemberDeleteEvent):
+        if (names := self.bot.member_names.get(event.guild_id)) is not None:
+            names.remove(event.user.id)
+        if (search := self.bot.member_search.get(event.guild_id)) is not None:
+            search.remove(event.user.id)
+        if (stats := self.bot.guild_stats.get(event.guild_id)) is not None:
+            stats.remove_member(event.user.is_bot)
+
+    @plugins.listener()
+    async def on_own_user_update(self, event: OwnUserUpdateEvent):
+        self.bot.user_names.add(event.user.id, event.user.username)
+
+    def get_index_stats(self):
+        return {
+            "Guilds with member names": len(self.bot.member_names),
+            "Indexed members": sum(map(len, self.bot.member_names.values())),
+            "Indexed users": len(self.bot.user_names),
+            "Guilds with member search": len(self.bot.member_search),
+            "Guilds with stats": len(self.bot.guild_stats),
+            "Role hierarchies": len(self.bot.role_hierarchies),
+        }
+
+
+def load(bot):
+    bot.add_plugin(Indexes(bot))
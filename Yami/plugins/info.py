@@ -11,10 +11,12 @@ from lightbulb import commands, checks, cooldowns
 from lightbulb.context import Context
 
 from Yami.converters.guild import guild_converter
-from Yami.converters.member import member_converter
+from Yami.converters.member import member_converter, search_members
 from Yami.converters.user import user_converter
 from Yami.subclasses.bot import Bot
 from Yami.subclasses.plugin import Plugin
+from Yami.utils.guild_stats import GuildStats
+from Yami.utils.roles import get_role_hierarchy
 from Yami.utils.text import ctx_name, m_name
 from Yami.utils.time import display_time_from_delta
 
@@ -76,15 +78,9 @@ class Info(Plugin):
     async def member(self, context: Context, member: member_converter = None):
         now = datetime.now(tz=timezone.utc)
         member: hikari.Member = member or context.member
-        roles = self.bot.cache.get_roles_view_for_guild(
-            context.guild_id
-        ).values() or await self.bot.rest.fetch_roles(context.guild_id)
-        roles = sorted(
-            [r for r in roles if r.id in member.role_ids],
-            key=lambda r: r.position,
-            reverse=True,
-        )
-        coloured_roles = list(filter(lambda r: r.colour.hex_code != "#000000", roles))
+        hierarchy = await get_role_hierarchy(self.bot, context.guild_id)
+        roles = hierarchy.sorted_roles(member.role_ids)
+        coloured_role = next((r for r in roles if r.colour), None)
         created_at = member.created_at.astimezone(timezone.utc)
         created_at = f"{created_at.strftime(self.date_format)}. {display_time_from_delta((now - created_at), granularity=2)} ago."
         joined_at = member.joined_at.astimezone(timezone.utc)
@@ -101,11 +97,9 @@ class Info(Plugin):
                 f"**Display Name:** `{m_name(member)}`\n"
                 f"**Nickname:** `{member.nickname}`\n"
                 f"**Rank:** {f'<@&{roles[0].id}>' if roles else '@everyone'}\n"
-                f"**• Member colour:** `{coloured_roles[0].colour.hex_code.upper() if coloured_roles else '#000000'}`\n",
+                f"**• Member colour:** `{coloured_role.colour.hex_code.upper() if coloured_role else '#000000'}`\n",
                 timestamp=now,
-                colour=coloured_roles[0].colour
-                if coloured_roles
-                else randint(0, 0xFFF),
+                colour=coloured_role.colour if coloured_role else randint(0, 0xFFF),
             )
             .add_field(
                 inline=False,
@@ -120,6 +114,26 @@ class Info(Plugin):
         )
         await context.reply(embed=embed)
 
+    @checks.guild_only()
+    @cooldowns.cooldown(length=10, usages=3, bucket=cooldowns.UserBucket)
+    @inspect.command(aliases=["s", "find"])
+    async def search(self, context: Context, *, query: str):
+        matches = search_members(self.bot, context.guild_id, query, limit=10)
+        embed = hikari.Embed(
+            title="Member Search",
+            description="\n".join(
+                f"`{score:.0%}` {member.mention} `{member.username}#{member.discriminator}`"
+                for member, score in matches
+            )
+            or f"No members found matching `{query}`.",
+            colour=randint(0, 0xFFF),
+            timestamp=datetime.now(tz=timezone.utc),
+        ).set_footer(
+            text=f"Requested by {ctx_name(context)}",
+            icon=context.author.avatar_url,
+        )
+        await context.reply(embed=embed)
+
     @cooldowns.cooldown(length=30, usages=3, bucket=cooldowns.UserBucket)
     @inspect.command(aliases=["u"])
     async def user(self, context: Context, user: user_converter = None):
@@ -171,14 +185,14 @@ class Info(Plugin):
         created_at = guild.created_at.astimezone(timezone.utc)
 
         created_at = f"{created_at.strftime(self.date_format)}. {display_time_from_delta((now - created_at), granularity=2)} ago."
-        roles = self.bot.cache.get_roles_view_for_guild(
-            guild.id
-        ).values() or await self.bot.rest.fetch_roles(guild.id)
-        roles = sorted(
-            [r for r in roles if r.position != 0],
-            key=lambda r: r.position,
-            reverse=True,
+        hierarchy = await get_role_hierarchy(self.bot, guild.id)
+        stats = self.bot.guild_stats.get(guild.id) or GuildStats.from_views(
+            self.bot.cache.get_members_view_for_guild(guild.id).values(),
+            self.bot.cache.get_guild_channels_view_for_guild(guild.id).values(),
+            hierarchy.roles,
+            self.bot.cache.get_emojis_view_for_guild(guild.id).values(),
         )
+        roles = [r for r in hierarchy.roles if r.position != 0]
         roles_names_or_mentions = (
             [f"<@&{role.id}>" for role in roles]
             if guild.id == context.guild_id
@@ -192,16 +206,16 @@ class Info(Plugin):
                 description=f"**Name:** `{guild.name}`\n"
                 f"**ID:** `{guild.id}`\n"
                 f"**Owner:** `{self.bot.cache.get_user(guild.owner_id) or await self.bot.rest.fetch_user(guild.owner_id)}`\n"
-                f"**Members:** `{len(guild.members)}`\n"
-                f"**• Humans:** `{len([member for member in guild.members.values() if not member.is_bot])}`\n"
-                f"**• Bots:** `{len([member for member in guild.members.values() if member.is_bot])}`\n"
-                f"**Roles:** `{len(guild.roles)}`\n"
-                f"**Emojis:** `{len(guild.emojis)}`\n"
+                f"**Members:** `{stats.members}`\n"
+                f"**• Humans:** `{stats.humans}`\n"
+                f"**• Bots:** `{stats.bots}`\n"
+                f"**Roles:** `{stats.roles}`\n"
+                f"**Emojis:** `{stats.emojis}`\n"
                 f"**Created at:** `{created_at}`\n"
-                f"**Channels:** `{len(guild.channels)}`\n"
-                f"**• Categories:** `{len(list(filter(lambda channel: isinstance(channel, hikari.GuildCategory), guild.channels.values())))}`\n"
-                f"**• Text:** `{len(list(filter(lambda channel: isinstance(channel, hikari.GuildTextChannel), guild.channels.values())))}`\n"
-                f"**• Voice:** `{len(list(filter(lambda channel: isinstance(channel, hikari.GuildVoiceChannel), guild.channels.values())))}`\n"
+                f"**Channels:** `{stats.channel_count}`\n"
+                f"**• Categories:** `{stats.channels[hikari.ChannelType.GUILD_CATEGORY]}`\n"
+                f"**• Text:** `{stats.channels[hikari.ChannelType.GUILD_TEXT]}`\n"
+                f"**• Voice:** `{stats.channels[hikari.ChannelType.GUILD_VOICE]}`\n"
                 f"**Region:** `{guild.region}`\n"
                 f"**AFK Channel:** {f'<#{guild.afk_channel_id}>' if guild.afk_channel_id else '`None`'}\n"
                 f"**AFK Timeout:** `{guild.afk_timeout}`\n"
@@ -1,10 +1,9 @@
 import asyncio
-import collections
 import contextlib
-import importlib
 import inspect
 import io
 import logging
+import os
 import platform
 import re
 import textwrap
@@ -21,61 +20,12 @@ from lightbulb.utils import EmbedNavigator, EmbedPaginator
 
 from Yami.converters.command import command_or_plugin_converter
 from Yami.subclasses.plugin import Plugin
+from Yami.utils.modules import EVAL_MODULES, LazyModules, referenced_names
+from Yami.utils.shell import OutputBuffer, run_streaming
 from Yami.utils.text import ctx_name
 
 
-def maybe_import(lib):
-    # noinspection PyBroadException
-    try:
-        module = importlib.import_module(lib)
-        return module
-    except Exception:
-        return None
-
-
-class _ModuleDict(collections.OrderedDict):
-    """Used internally to make """
-
-    def __str__(self):
-        k: str
-        return f"ModuleDict({{{','.join(str(k) for k in self.keys())}}})"
-
-    __repr__ = __str__
-
-
-modules = _ModuleDict(
-    {
-        "aiohttp": maybe_import("aiohttp"),
-        "async_timeout": maybe_import("async_timeout"),
-        "asyncio": maybe_import("asyncio"),
-        "collections": maybe_import("collections"),
-        "dataclasses": maybe_import("dataclasses"),
-        "decimal": maybe_import("decimal"),
-        "functools": maybe_import("functools"),
-        "hashlib": maybe_import("hashlib"),
-        "inspect": maybe_import("inspect"),
-        "io": maybe_import("io"),
-        "json": maybe_import("json"),
-        "math": maybe_import("math"),
-        "os": maybe_import("os"),
-        "random": maybe_import("random"),
-        "re": maybe_import("re"),
-        "requests": maybe_import("requests"),
-        "statistics": maybe_import("statistics"),
-        "sys": maybe_import("sys"),
-        "textwrap": maybe_import("textwrap"),
-        "urllib": maybe_import("urllib"),
-        "urlparse": maybe_import("urllib.parse"),
-        "weakref": maybe_import("weakref"),
-        "bs4": maybe_import("bs4"),
-        "subprocess": maybe_import("subprocess"),
-        "time": maybe_import("time"),
-        "datetime": maybe_import("datetime"),
-        "hikari": maybe_import("hikari"),
-        "lightbulb": maybe_import("lightbulb"),
-        "PIL": maybe_import("PIL"),
-    }
-)
+modules = LazyModules(EVAL_MODULES)
 
 
 # noinspection PyProtectedMember
@@ -84,6 +34,10 @@ class SuperUser(Plugin):
         super().__init__(bot)
         self.pattern = re.compile(r"```(?P<syntax>.*)\n(?P<body>[^`]+?)```")
         self.last_result = None
+        self.bot.stats_providers["Eval modules"] = lambda: modules.stats
+
+    def plugin_remove(self):
+        self.bot.stats_providers.pop("Eval modules", None)
 
     @staticmethod
     def get_syntax_error(error: SyntaxError) -> str:
@@ -131,8 +85,10 @@ class SuperUser(Plugin):
                 }
                 env.update(globals())
                 env.update(locals())
-                env.update(modules)
-                exec(body, env)
+                code = compile(body, "<eval>", "exec")
+                # Only import the modules the body actually refers to.
+                env.update(modules.resolve(referenced_names(code)))
+                exec(code, env)
                 self.last_result = await env["__invoke__"](context.bot, context)
                 stream.write(f"- Returned: {self.last_result!r}")
             except SyntaxError as e:
@@ -176,29 +132,61 @@ class SuperUser(Plugin):
     async def execute_in_shell(self, context: Context, body):
         start = datetime.now(tz=timezone.utc)
         body = self.clean(body)
-        stack = contextlib.ExitStack()
-        stream = io.StringIO()
-        stack.enter_context(contextlib.redirect_stdout(stream))
-        stack.enter_context(contextlib.redirect_stderr(stream))
+        output = OutputBuffer(
+            int(os.getenv("YAMI_SHELL_BUFFER_BYTES", 64 * 1024)),
+            max_spill_bytes=int(
+                os.getenv("YAMI_SHELL_ATTACHMENT_BYTES", 8 * 1024 * 1024)
+            ),
+        )
 
-        with stack:
-            process = await asyncio.create_subprocess_shell(
-                body,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await process.communicate()
-            stream.write(stdout.decode())
-            stream.write(stderr.decode())
+        def redact(text):
+            return text.replace(context.bot._token, "~TOKEN~")
 
-        stream.write(f"\n- Return code {process.returncode}")
-        stream.seek(0)
-        lines = (
-            "\n".join(stream.readlines())
-            .replace(context.bot._token, "~TOKEN~")
-            .replace("`", "´")
+        def elapsed():
+            return (datetime.now(tz=timezone.utc) - start).total_seconds() * 1000
+
+        progress = await context.reply(
+            embed=hikari.Embed(title="Running...", colour=0x3498DB)
         )
 
+        async def update():
+            tail = redact(output.tail())[-1000:].replace("`", "´")
+            await progress.edit(
+                embed=hikari.Embed(
+                    title=f"Running for {elapsed():.0f}ms",
+                    colour=0x3498DB,
+                    description=f"```diff\n{tail}```" if tail else None,
+                    timestamp=datetime.now(tz=timezone.utc),
+                )
+            )
+
+        try:
+            returncode = await run_streaming(
+                body,
+                output,
+                timeout=float(os.getenv("YAMI_SHELL_TIMEOUT", 120)),
+                on_update=update,
+            )
+            lines = redact(output.tail()).replace("`", "´")
+            if output.overflowed:
+                lines = f"- Showing the last {output.max_bytes} of {output.total} bytes\n{lines}"
+            lines += (
+                f"\n- Return code {returncode}"
+                if returncode is not None
+                else "\n- Killed after timing out"
+            )
+            attachment = (
+                hikari.Bytes(
+                    redact(output.read_spill().decode(errors="replace")).encode(),
+                    "output.txt",
+                )
+                if output.overflowed
+                else None
+            )
+        finally:
+            output.close()
+            await progress.delete()
+
         paginator = EmbedPaginator(
             max_lines=27, prefix="```diff\n", suffix="```", max_chars=1048
         )
@@ -206,8 +194,8 @@ class SuperUser(Plugin):
         @paginator.embed_factory()
         def make_page(index, page):
             return hikari.Embed(
-                title=f"Executed in {(datetime.now(tz=timezone.utc) - start).total_seconds() * 1000:.2f}ms",
-                colour=0x58EF92 if process.returncode == 0 else 0xE74C3C,
+                title=f"Executed in {elapsed():.2f}ms",
+                colour=0x58EF92 if returncode == 0 else 0xE74C3C,
                 description=f"Result: {page}",
                 timestamp=datetime.now(tz=timezone.utc),
             ).set_footer(
@@ -220,6 +208,11 @@ class SuperUser(Plugin):
             + lines
         )
 
+        if attachment is not None:
+            await context.reply(
+                "Full output" + (" (truncated)" if output.truncated else "") + ":",
+                attachment=attachment,
+            )
         navigator = EmbedNavigator(pages=paginator.build_pages())
         await navigator.run(context)
 
@@ -323,6 +316,53 @@ class SuperUser(Plugin):
         navigator = EmbedNavigator(paginator.build_pages())
         await navigator.run(context)
 
+    @staticmethod
+    async def send_stats(
+        context: Context,
+        providers: typing.Mapping[
+            str, typing.Callable[[], typing.Mapping[str, typing.Any]]
+        ],
+    ):
+        paginator = EmbedPaginator(max_lines=27, max_chars=1028)
+
+        @paginator.embed_factory()
+        def make_page(index, page):
+            return hikari.Embed(
+                title="Stats",
+                description=page,
+                colour=randint(0, 0xFFF),
+                timestamp=datetime.now(tz=timezone.utc),
+            ).set_footer(
+                text=f"#{index}/{len(paginator)}, Requested by {ctx_name(context)}",
+                icon=context.author.avatar_url,
+            )
+
+        for key, provider in providers.items():
+            paginator.add_line(f"**{key}**")
+            for stat, value in provider().items():
+                paginator.add_line(f"• {stat}: `{value}`")
+        navigator = EmbedNavigator(paginator.build_pages())
+        await navigator.run(context)
+
+    @checks.owner_only()
+    @commands.command(aliases=["metrics"])
+    async def stats(self, context: Context, *, name: str = None):
+        providers = {
+            key: provider
+            for key, provider in self.bot.stats_providers.items()
+            if name is None or name.lower() in key.lower()
+        }
+        if not providers:
+            return await context.reply(f"No stats found matching `{name}`.")
+        await self.send_stats(context, providers)
+
+    @checks.owner_only()
+    @commands.command(aliases=["db", "dbstats"])
+    async def database(self, context: Context):
+        if (provider := self.bot.stats_providers.get("Database pool")) is None:
+            return await context.reply("The database is not initialized.")
+        await self.send_stats(context, {"Database pool": provider})
+
     @checks.owner_only()
     @commands.command(name="selfclean", aliases=["sclean", "sclear"])
     async def self_clean(self, context: Context, amount: int = 30):
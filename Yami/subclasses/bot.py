@@ -8,6 +8,17 @@ from datetime import datetime, timezone
 import hikari
 import lightbulb
 from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
+
+from Yami import migrations, models
+from Yami.converters.command import CommandIndex
+from Yami.converters.fetch import fetcher
+from Yami.utils.database import PoolMonitor, get_acquire_timeout, get_pool_options
+from Yami.utils.guild_stats import GuildStats
+from Yami.utils.http import HTTPClient, get_http_options
+from Yami.utils.names import NameIndex
+from Yami.utils.roles import RoleHierarchy
+from Yami.utils.search import TrigramIndex
 
 
 class Bot(lightbulb.Bot):
@@ -16,11 +27,44 @@ class Bot(lightbulb.Bot):
         self.user: typing.Optional[hikari.User] = None
         self.logger = logger or logging.getLogger(__name__)
         self.start_time = datetime.now(tz=timezone.utc)
+        self.stats_providers: typing.Dict[
+            str, typing.Callable[[], typing.Mapping[str, typing.Any]]
+        ] = {
+            "Guild settings cache": lambda: models.guild_cache.stats,
+            "Converter fetches": lambda: fetcher.stats,
+        }
+        self.pool_monitor: typing.Optional[PoolMonitor] = None
+        self.member_names: typing.Dict[hikari.Snowflake, NameIndex] = {}
+        self.user_names = NameIndex(prefix_search=True)
+        self.member_search: typing.Dict[hikari.Snowflake, TrigramIndex] = {}
+        self.command_index: typing.Optional[CommandIndex] = None
+        self.guild_stats: typing.Dict[hikari.Snowflake, GuildStats] = {}
+        self.role_hierarchies: typing.Dict[hikari.Snowflake, RoleHierarchy] = {}
+        self.http_client = HTTPClient(**get_http_options())
+        self.stats_providers["HTTP client"] = lambda: self.http_client.stats
 
     async def initialize_database(self):
         if db_url := os.getenv("YAMI_DB_URL"):
-            await Tortoise.init(db_url=db_url, modules={"models": ["Yami.models"]})
-            await Tortoise.generate_schemas()
+            connection = expand_db_url(db_url)
+            connection["credentials"].update(get_pool_options())
+            await Tortoise.init(
+                config={
+                    "connections": {"default": connection},
+                    "apps": {
+                        "models": {
+                            "models": ["Yami.models"],
+                            "default_connection": "default",
+                        }
+                    },
+                }
+            )
+            await migrations.migrate()
+            # noinspection PyProtectedMember
+            self.pool_monitor = PoolMonitor(
+                Tortoise.get_connection("default")._pool,
+                acquire_timeout=get_acquire_timeout(),
+            )
+            self.stats_providers["Database pool"] = lambda: self.pool_monitor.stats
         else:
             self.logger.error(
                 "Please set an environment variable called `YAMI_DB_URL` and set its value to the DB url.",
@@ -53,6 +97,23 @@ class Bot(lightbulb.Bot):
                     )
                 )
 
+    def add_plugin(self, *args, **kwargs):
+        self.command_index = None
+        return super().add_plugin(*args, **kwargs)
+
+    def remove_plugin(self, *args, **kwargs):
+        self.command_index = None
+        return super().remove_plugin(*args, **kwargs)
+
+    def add_command(self, *args, **kwargs):
+        self.command_index = None
+        return super().add_command(*args, **kwargs)
+
+    def remove_command(self, *args, **kwargs):
+        self.command_index = None
+        return super().remove_command(*args, **kwargs)
+
     async def close(self) -> None:
+        await self.http_client.close()
         await Tortoise.close_connections()
         await super().close()
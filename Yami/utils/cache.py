@@ -0,0 +1,118 @@
+import collections
+import time
+import typing
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(typing.Generic[K, V]):
+    """Bounded mapping which evicts the least recently used entry, and optionally entries older than `ttl` seconds.
+
+    When `sizeof` is given, the cache also accounts the size of its values and keeps their total under `max_bytes`.
+    `on_evict` is called with the key and value of every entry evicted for capacity or age.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        ttl: typing.Optional[float] = None,
+        sizeof: typing.Optional[typing.Callable[[V], int]] = None,
+        max_bytes: typing.Optional[int] = None,
+        on_evict: typing.Optional[typing.Callable[[K, V], None]] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "collections.OrderedDict[K, typing.Tuple[float, V, int]]" = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        if (entry := self._data.get(key)) is None:
+            return False
+        if self._expired(entry[0]):
+            self._evict(key)
+            return False
+        return True
+
+    def __iter__(self) -> typing.Iterator[K]:
+        return iter(list(self._data))
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - stored_at > self.ttl
+
+    def _evict(self, key: K) -> None:
+        _, value, size = self._data.pop(key)
+        self.bytes -= size
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _full(self) -> bool:
+        return len(self._data) > self.maxsize or (
+            self.max_bytes is not None and self.bytes > self.max_bytes
+        )
+
+    def get(self, key: K, default: typing.Any = None) -> typing.Optional[V]:
+        if (entry := self._data.get(key)) is None:
+            self.misses += 1
+            return default
+        stored_at, value, _ = entry
+        if self._expired(stored_at):
+            self._evict(key)
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        if (entry := self._data.get(key)) is not None:
+            self.bytes -= entry[2]
+        self._data[key] = (time.monotonic(), value, size)
+        self._data.move_to_end(key)
+        self.bytes += size
+        while self._data and self._full():
+            self._evict(next(iter(self._data)))
+
+    def pop(self, key: K, default: typing.Any = None) -> typing.Optional[V]:
+        if (entry := self._data.pop(key, _MISSING)) is _MISSING:
+            return default
+        self.bytes -= entry[2]
+        return entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        lookups = self.hits + self.misses
+        stats = {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": f"{self.hits / lookups:.2%}" if lookups else "n/a",
+        }
+        if self.sizeof is not None:
+            stats["bytes"] = self.bytes
+            stats["max_bytes"] = self.max_bytes
+        return stats
@@ -0,0 +1,226 @@
+import asyncio
+import contextlib
+import logging
+import typing
+
+K = typing.TypeVar("K")
+T = typing.TypeVar("T")
+V = typing.TypeVar("V")
+
+logger = logging.getLogger("Yami.utils.concurrency")
+
+
+class Batcher(typing.Generic[T]):
+    """Collects items and hands them to `callback` in one go once `window` seconds pass or `max_size` is reached."""
+
+    def __init__(
+        self,
+        callback: typing.Callable[[typing.Set[T]], typing.Awaitable[typing.Any]],
+        *,
+        window: float = 2.0,
+        max_size: int = 500,
+    ) -> None:
+        self.callback = callback
+        self.window = window
+        self.max_size = max_size
+        self.batches = 0
+        self.items = 0
+        self._pending: typing.Set[T] = set()
+        self._timer: typing.Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, item: T) -> None:
+        self._pending.add(item)
+        if len(self._pending) >= self.max_size:
+            asyncio.create_task(self.flush())
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        self._timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        items, self._pending = self._pending, set()
+        if not items:
+            return
+        self.batches += 1
+        self.items += len(items)
+        # noinspection PyBroadException
+        try:
+            await self.callback(items)
+        except Exception:
+            logger.exception("Failed to process batch of %s items", len(items))
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+
+class Debouncer(typing.Generic[K, T]):
+    """Coalesces bursts of items per key into one callback once `delay` seconds pass without new items,
+    or `max_delay` seconds after the first item of the burst."""
+
+    def __init__(
+        self,
+        callback: typing.Callable[[K, typing.List[T]], typing.Awaitable[typing.Any]],
+        *,
+        delay: float = 2.0,
+        max_delay: float = 10.0,
+    ) -> None:
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max_delay
+        self.received = 0
+        self.calls = 0
+        self._pending: typing.Dict[K, typing.List[T]] = {}
+        self._first_seen: typing.Dict[K, float] = {}
+        self._timers: typing.Dict[K, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def merged(self) -> int:
+        return self.received - self.calls - sum(map(len, self._pending.values()))
+
+    def schedule(self, key: K, item: T) -> None:
+        self.received += 1
+        now = asyncio.get_event_loop().time()
+        self._pending.setdefault(key, []).append(item)
+        first_seen = self._first_seen.setdefault(key, now)
+        if (timer := self._timers.get(key)) is not None:
+            timer.cancel()
+        delay = max(0.0, min(self.delay, first_seen + self.max_delay - now))
+        self._timers[key] = asyncio.create_task(self._run_later(key, delay))
+
+    async def _run_later(self, key: K, delay: float) -> None:
+        await asyncio.sleep(delay)
+        del self._timers[key]
+        del self._first_seen[key]
+        items = self._pending.pop(key)
+        self.calls += 1
+        # noinspection PyBroadException
+        try:
+            await self.callback(key, items)
+        except Exception:
+            logger.exception(
+                "Failed to process %s coalesced items for %s", len(items), key
+            )
+
+    def cancel(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._first_seen.clear()
+        self._pending.clear()
+
+
+class _KeyedLockEntry:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class KeyedLock(typing.Generic[K]):
+    """Serializes work per key while different keys run concurrently.
+
+    Locks only exist while a task holds or waits on them, so the registry stays as small as the work in flight.
+    """
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.contended = 0
+        self._entries: typing.Dict[K, _KeyedLockEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def locked(self, key: K) -> bool:
+        return (entry := self._entries.get(key)) is not None and entry.lock.locked()
+
+    @contextlib.asynccontextmanager
+    async def __call__(self, key: K) -> typing.AsyncIterator[None]:
+        entry = self._entries.setdefault(key, _KeyedLockEntry())
+        entry.users += 1
+        self.acquisitions += 1
+        if entry.lock.locked():
+            self.contended += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._entries[key]
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "active": len(self._entries),
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+        }
+
+
+class SingleFlight(typing.Generic[K, V]):
+    """Shares a single in-flight call per key between all concurrent callers."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.shared = 0
+        self._flights: typing.Dict[K, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: K, factory: typing.Callable[[], typing.Awaitable[V]]) -> V:
+        if (flight := self._flights.get(key)) is not None:
+            self.shared += 1
+        else:
+            self.calls += 1
+            flight = self._flights[key] = asyncio.ensure_future(factory())
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the call for everyone else.
+        return await asyncio.shield(flight)
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "in flight": len(self._flights),
+            "calls": self.calls,
+            "deduplicated": self.shared,
+        }
+
+
+async def first_preferred(
+    *awaitables: typing.Awaitable[typing.Optional[T]],
+) -> typing.Optional[T]:
+    """Run `awaitables` concurrently and return the first non-`None` result in argument order, cancelling the rest.
+
+    Failures of preferred awaitables fall through to the next one; the first error is raised if nothing succeeds.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    error: typing.Optional[BaseException] = None
+    try:
+        for task in tasks:
+            try:
+                if (result := await task) is not None:
+                    return result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,111 @@
+import asyncio
+import collections
+import os
+import time
+import typing
+
+ACQUIRE_BUCKETS: typing.Final[typing.Tuple[float, ...]] = (1, 5, 10, 50, 100, 500)
+
+
+def get_pool_options() -> typing.Dict[str, typing.Any]:
+    """asyncpg pool settings, read from `YAMI_DB_*` environment variables."""
+    return {
+        "minsize": int(os.getenv("YAMI_DB_POOL_MIN_SIZE", 1)),
+        "maxsize": int(os.getenv("YAMI_DB_POOL_MAX_SIZE", 10)),
+        "statement_cache_size": int(os.getenv("YAMI_DB_STATEMENT_CACHE_SIZE", 100)),
+        "max_inactive_connection_lifetime": float(
+            os.getenv("YAMI_DB_MAX_INACTIVE_CONNECTION_LIFETIME", 300.0)
+        ),
+    }
+
+
+def get_acquire_timeout() -> typing.Optional[float]:
+    if timeout := os.getenv("YAMI_DB_ACQUIRE_TIMEOUT", "10"):
+        return float(timeout)
+    return None
+
+
+class _MonitoredAcquire:
+    def __init__(self, monitor: "PoolMonitor", timeout: typing.Optional[float]) -> None:
+        self.monitor = monitor
+        self.timeout = timeout
+        self.connection = None
+
+    def __await__(self):
+        return self.monitor.timed_acquire(self.timeout).__await__()
+
+    async def __aenter__(self):
+        self.connection = await self.monitor.timed_acquire(self.timeout)
+        return self.connection
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.monitor.release(self.connection)
+
+
+class PoolMonitor:
+    """Wraps an asyncpg pool's acquire and release to track saturation and acquire latency."""
+
+    def __init__(self, pool: typing.Any, *, acquire_timeout: float = None) -> None:
+        self.pool = pool
+        self.acquire_timeout = acquire_timeout
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.waiters = 0
+        self.histogram: typing.Counter[str] = collections.Counter()
+        self._acquire = pool.acquire
+        self._release = pool.release
+        pool.acquire = self.acquire
+        pool.release = self.release
+
+    def acquire(self, *, timeout: float = None) -> _MonitoredAcquire:
+        return _MonitoredAcquire(self, timeout or self.acquire_timeout)
+
+    async def timed_acquire(self, timeout: typing.Optional[float]) -> typing.Any:
+        self.waiters += 1
+        start = time.perf_counter()
+        try:
+            connection = await self._acquire(timeout=timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiters -= 1
+        elapsed = (time.perf_counter() - start) * 1000
+        bucket = next(
+            (f"<={bound}ms" for bound in ACQUIRE_BUCKETS if elapsed <= bound),
+            f">{ACQUIRE_BUCKETS[-1]}ms",
+        )
+        self.histogram[bucket] += 1
+        self.acquisitions += 1
+        self.in_use += 1
+        return connection
+
+    async def release(self, connection: typing.Any, *, timeout: float = None) -> None:
+        self.in_use -= 1
+        await self._release(connection, timeout=timeout)
+
+    @property
+    def size(self) -> int:
+        if hasattr(self.pool, "get_size"):
+            return self.pool.get_size()
+        # noinspection PyProtectedMember
+        return sum(holder._con is not None for holder in self.pool._holders)
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        buckets = [f"<={bound}ms" for bound in ACQUIRE_BUCKETS]
+        buckets.append(f">{ACQUIRE_BUCKETS[-1]}ms")
+        return {
+            "size": self.size,
+            "in use": self.in_use,
+            "idle": max(0, self.size - self.in_use),
+            "waiters": self.waiters,
+            "acquisitions": self.acquisitions,
+            "acquire timeouts": self.timeouts,
+            **{
+                f"acquire {bucket}": self.histogram[bucket]
+                for bucket in buckets
+                if self.histogram[bucket]
+            },
+        }
@@ -0,0 +1,60 @@
+import collections
+import typing
+
+
+class GuildStats:
+    """Member, channel, role and emoji counts for a guild, kept up to date from gateway events."""
+
+    def __init__(self) -> None:
+        self.members = 0
+        self.bots = 0
+        self.channels: typing.Counter[typing.Hashable] = collections.Counter()
+        self.roles = 0
+        self.emojis = 0
+
+    @classmethod
+    def from_views(
+        cls,
+        members: typing.Iterable[typing.Any] = (),
+        channels: typing.Iterable[typing.Any] = (),
+        roles: typing.Iterable[typing.Any] = (),
+        emojis: typing.Iterable[typing.Any] = (),
+    ) -> "GuildStats":
+        stats = cls()
+        stats.count_members(members)
+        for channel in channels:
+            stats.add_channel(channel.type)
+        stats.roles = sum(1 for _ in roles)
+        stats.emojis = sum(1 for _ in emojis)
+        return stats
+
+    @property
+    def humans(self) -> int:
+        return self.members - self.bots
+
+    def count_members(self, members: typing.Iterable[typing.Any]) -> None:
+        """Replace the member counts with a recount of `members`."""
+        self.members = self.bots = 0
+        for member in members:
+            self.add_member(member.is_bot)
+
+    def add_member(self, is_bot: bool) -> None:
+        self.members += 1
+        self.bots += is_bot
+
+    def remove_member(self, is_bot: bool) -> None:
+        self.members = max(self.members - 1, 0)
+        self.bots = max(self.bots - is_bot, 0)
+
+    def add_channel(self, channel_type: typing.Hashable) -> None:
+        self.channels[channel_type] += 1
+
+    def remove_channel(self, channel_type: typing.Hashable) -> None:
+        if self.channels[channel_type] > 1:
+            self.channels[channel_type] -= 1
+        else:
+            del self.channels[channel_type]
+
+    @property
+    def channel_count(self) -> int:
+        return sum(self.channels.values())
@@ -0,0 +1,145 @@
+import asyncio
+import collections
+import contextlib
+import logging
+import os
+import time
+import typing
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES: typing.Final[typing.FrozenSet[int]] = frozenset(
+    {429, 500, 502, 503, 504}
+)
+
+
+def get_http_options() -> typing.Dict[str, typing.Any]:
+    """HTTP client options overridden through `YAMI_HTTP_*` environment variables."""
+    options = {}
+    for option, cast in (
+        ("limit", int),
+        ("limit_per_host", int),
+        ("keepalive_timeout", float),
+        ("timeout", float),
+        ("retries", int),
+    ):
+        if (value := os.getenv(f"YAMI_HTTP_{option.upper()}")) is not None:
+            options[option] = cast(value)
+    return options
+
+
+class HTTPClient:
+    """One pooled `aiohttp.ClientSession` shared by every plugin, with retries and per-host metrics.
+
+    The session is created on first use so it binds to the running event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 10.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.hosts: typing.DefaultDict[
+            str, typing.Counter[str]
+        ] = collections.defaultdict(collections.Counter)
+        self.retried = 0
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._trace = aiohttp.TraceConfig()
+        self._trace.on_request_start.append(self._on_request_start)
+        self._trace.on_request_end.append(self._on_request_end)
+        self._trace.on_request_exception.append(self._on_request_exception)
+        self._trace.on_connection_create_end.append(self._on_connection_create)
+        self._trace.on_connection_reuseconn.append(self._on_connection_reuse)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300,
+                ),
+                timeout=self.timeout,
+                trace_configs=[self._trace],
+            )
+        return self._session
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, retries: typing.Optional[int] = None, **kwargs
+    ) -> typing.AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request, retrying connection errors, timeouts and `RETRY_STATUSES` with exponential backoff."""
+        retries = self.retries if retries is None else retries
+        for attempt in range(retries + 1):
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == retries:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or attempt == retries:
+                    break
+                response.release()
+            self.retried += 1
+            delay = self.backoff * 2 ** attempt
+            logger.debug("Retrying %s %s in %.2fs", method, url, delay)
+            await asyncio.sleep(delay)
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _on_request_start(self, _, context, params) -> None:
+        context.host = params.url.host
+        context.started = time.perf_counter()
+
+    async def _on_request_end(self, _, context, params) -> None:
+        host = self.hosts[context.host]
+        host["requests"] += 1
+        host["latency"] += time.perf_counter() - context.started
+
+    async def _on_request_exception(self, _, context, params) -> None:
+        self.hosts[context.host]["errors"] += 1
+
+    async def _on_connection_create(self, _, context, params) -> None:
+        self.hosts[context.host]["connections created"] += 1
+
+    async def _on_connection_reuse(self, _, context, params) -> None:
+        self.hosts[context.host]["connections reused"] += 1
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        stats: typing.Dict[str, typing.Any] = {"retries": self.retried}
+        for name, host in self.hosts.items():
+            connections = host["connections created"] + host["connections reused"]
+            stats[f"{name} requests"] = host["requests"]
+            stats[f"{name} errors"] = host["errors"]
+            stats[
+                f"{name} average latency"
+            ] = f"{host['latency'] / host['requests'] * 1000 if host['requests'] else 0:.1f}ms"
+            stats[f"{name} connection reuse"] = (
+                f"{host['connections reused'] / connections:.0%}"
+                if connections
+                else "n/a"
+            )
+        return stats
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import pathlib
+import time
+import typing
+
+from Yami.utils.cache import LRUCache
+from Yami.utils.http import HTTPClient
+
+logger = logging.getLogger(__name__)
+
+
+class CachedMedia(typing.NamedTuple):
+    data: bytes
+    etag: typing.Optional[str]
+    last_modified: typing.Optional[str]
+    fetched_at: float
+
+
+class MediaCache:
+    """Byte-budgeted LRU of downloaded media, revalidated with ETag/If-Modified-Since once older than `max_age`.
+
+    When `spill_dir` is set, entries evicted from memory are written there and read back on a later miss.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_age: float = 3600.0,
+        spill_dir: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+    ) -> None:
+        self.max_age = max_age
+        self.spill_dir = pathlib.Path(spill_dir) if spill_dir is not None else None
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.memory: LRUCache[typing.Hashable, CachedMedia] = LRUCache(
+            10_000,
+            sizeof=lambda media: len(media.data),
+            max_bytes=max_bytes,
+            on_evict=self._spill,
+        )
+        self.revalidated = 0
+        self.downloaded = 0
+        self.spilled = 0
+
+    def _spill_path(self, key: typing.Hashable) -> pathlib.Path:
+        return self.spill_dir / hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def _spill(self, key: typing.Hashable, media: CachedMedia) -> None:
+        if self.spill_dir is None:
+            return
+        path = self._spill_path(key)
+        try:
+            path.with_suffix(".bin").write_bytes(media.data)
+            path.with_suffix(".json").write_text(
+                json.dumps([media.etag, media.last_modified, media.fetched_at])
+            )
+        except OSError:
+            logger.warning("Failed to spill %r to %s", key, path, exc_info=True)
+        else:
+            self.spilled += 1
+
+    def _unspill(self, key: typing.Hashable) -> typing.Optional[CachedMedia]:
+        if self.spill_dir is None:
+            return None
+        path = self._spill_path(key)
+        try:
+            media = CachedMedia(
+                path.with_suffix(".bin").read_bytes(),
+                *json.loads(path.with_suffix(".json").read_text()),
+            )
+        except (OSError, ValueError, TypeError):
+            return None
+        # Back in memory it will be spilled again on eviction, so the copy on disk can go.
+        path.with_suffix(".bin").unlink(missing_ok=True)
+        path.with_suffix(".json").unlink(missing_ok=True)
+        self.memory.put(key, media)
+        return media
+
+    def get(self, key: typing.Hashable) -> typing.Optional[CachedMedia]:
+        if (media := self.memory.get(key)) is not None:
+            return media
+        return self._unspill(key)
+
+    def is_fresh(self, media: CachedMedia) -> bool:
+        return time.time() - media.fetched_at <= self.max_age
+
+    async def fetch(
+        self, client: HTTPClient, key: typing.Hashable, url: str
+    ) -> typing.Optional[CachedMedia]:
+        """The media at `url`, from cache when fresh, or `None` if it does not exist."""
+        cached = self.get(key)
+        if cached is not None and self.is_fresh(cached):
+            return cached
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        async with client.request("GET", url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                self.revalidated += 1
+                media = cached._replace(fetched_at=time.time())
+            elif response.status == 404:
+                self.memory.pop(key)
+                return None
+            else:
+                response.raise_for_status()
+                self.downloaded += 1
+                media = CachedMedia(
+                    await response.read(),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    time.time(),
+                )
+        self.memory.put(key, media)
+        return media
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            **self.memory.stats,
+            "downloaded": self.downloaded,
+            "revalidated": self.revalidated,
+            "spilled": self.spilled,
+        }
@@ -0,0 +1,104 @@
+import importlib
+import time
+import types
+import typing
+
+# Names made available to the eval command, mapped to the module they import.
+EVAL_MODULES: typing.Final[typing.Mapping[str, str]] = {
+    "aiohttp": "aiohttp",
+    "async_timeout": "async_timeout",
+    "asyncio": "asyncio",
+    "collections": "collections",
+    "dataclasses": "dataclasses",
+    "decimal": "decimal",
+    "functools": "functools",
+    "hashlib": "hashlib",
+    "inspect": "inspect",
+    "io": "io",
+    "json": "json",
+    "math": "math",
+    "os": "os",
+    "random": "random",
+    "re": "re",
+    "requests": "requests",
+    "statistics": "statistics",
+    "sys": "sys",
+    "textwrap": "textwrap",
+    "urllib": "urllib",
+    "urlparse": "urllib.parse",
+    "weakref": "weakref",
+    "bs4": "bs4",
+    "subprocess": "subprocess",
+    "time": "time",
+    "datetime": "datetime",
+    "hikari": "hikari",
+    "lightbulb": "lightbulb",
+    "PIL": "PIL",
+}
+
+
+def maybe_import(lib):
+    # noinspection PyBroadException
+    try:
+        module = importlib.import_module(lib)
+        return module
+    except Exception:
+        return None
+
+
+def referenced_names(code: types.CodeType) -> typing.Set[str]:
+    """Every global, attribute and imported name used by `code` and the functions nested in it."""
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= referenced_names(constant)
+    return names
+
+
+class LazyModules(typing.Mapping[str, typing.Optional[types.ModuleType]]):
+    """Module namespace which imports each module the first time it is looked up, timing the import."""
+
+    def __init__(self, paths: typing.Mapping[str, str]) -> None:
+        self.paths = dict(paths)
+        self.loaded: typing.Dict[str, typing.Optional[types.ModuleType]] = {}
+        self.load_times: typing.Dict[str, float] = {}
+
+    def __getitem__(self, name: str) -> typing.Optional[types.ModuleType]:
+        if name not in self.loaded:
+            path = self.paths[name]
+            start = time.perf_counter()
+            self.loaded[name] = maybe_import(path)
+            self.load_times[name] = time.perf_counter() - start
+        return self.loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.paths
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __str__(self):
+        return f"LazyModules({{{','.join(self.paths)}}})"
+
+    __repr__ = __str__
+
+    def resolve(
+        self, names: typing.Iterable[str]
+    ) -> typing.Dict[str, typing.Optional[types.ModuleType]]:
+        """Import and return the modules among `names`, ignoring names which are not modules."""
+        return {name: self[name] for name in names if name in self.paths}
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "available": len(self.paths),
+            "loaded": len(self.loaded),
+            **{
+                f"{name} import": f"{seconds * 1000:.2f}ms"
+                + ("" if self.loaded[name] is not None else " (missing)")
+                for name, seconds in self.load_times.items()
+            },
+        }
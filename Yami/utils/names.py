@@ -0,0 +1,95 @@
+import bisect
+import typing
+
+
+class NameIndex:
+    """Maps names to the IDs of the entities using them, exactly and case-insensitively.
+
+    With `prefix_search` the case-folded names are also kept sorted, so names can be searched by prefix.
+    """
+
+    def __init__(self, *, prefix_search: bool = False) -> None:
+        self._exact: typing.Dict[str, typing.Set[int]] = {}
+        self._folded: typing.Dict[str, typing.Set[int]] = {}
+        self._names: typing.Dict[int, typing.Tuple[str, ...]] = {}
+        self._sorted: typing.Optional[typing.List[str]] = [] if prefix_search else None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._names
+
+    @staticmethod
+    def _link(
+        index: typing.Dict[str, typing.Set[int]], name: str, entity_id: int
+    ) -> None:
+        index.setdefault(name, set()).add(entity_id)
+
+    @staticmethod
+    def _unlink(
+        index: typing.Dict[str, typing.Set[int]], name: str, entity_id: int
+    ) -> None:
+        if (ids := index.get(name)) is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del index[name]
+
+    def add(self, entity_id: int, *names: typing.Optional[str]) -> None:
+        """Index `entity_id` under `names`, replacing any names it was indexed under before."""
+        self.remove(entity_id)
+        names = tuple(dict.fromkeys(name for name in names if name))
+        self._names[entity_id] = names
+        for name in names:
+            self._link(self._exact, name, entity_id)
+            folded = name.casefold()
+            if self._sorted is not None and folded not in self._folded:
+                bisect.insort(self._sorted, folded)
+            self._link(self._folded, folded, entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        for name in self._names.pop(entity_id, ()):
+            self._unlink(self._exact, name, entity_id)
+            folded = name.casefold()
+            self._unlink(self._folded, folded, entity_id)
+            if self._sorted is not None and folded not in self._folded:
+                del self._sorted[bisect.bisect_left(self._sorted, folded)]
+
+    def get(
+        self, name: str, *, case_insensitive: bool = False
+    ) -> typing.FrozenSet[int]:
+        if case_insensitive:
+            return frozenset(self._folded.get(name.casefold(), ()))
+        return frozenset(self._exact.get(name, ()))
+
+    def names_of(self, entity_id: int) -> typing.Tuple[str, ...]:
+        return self._names.get(entity_id, ())
+
+    def startswith(self, prefix: str, *, limit: int = 25) -> typing.List[int]:
+        """IDs whose case-folded names start with `prefix`, shortest names first."""
+        if self._sorted is None:
+            raise TypeError("This index was created without prefix_search")
+        prefix = prefix.casefold()
+        keys = []
+        position = bisect.bisect_left(self._sorted, prefix)
+        while (
+            position < len(self._sorted)
+            and self._sorted[position].startswith(prefix)
+            and len(keys) < limit
+        ):
+            keys.append(self._sorted[position])
+            position += 1
+        keys.sort(key=len)
+        return list(
+            dict.fromkeys(
+                entity_id for key in keys for entity_id in sorted(self._folded[key])
+            )
+        )[:limit]
+
+    def search(self, name: str, *, limit: int = 25) -> typing.List[int]:
+        """All IDs matching `name`, ranked by exact, then case-insensitive, then prefix matches."""
+        ranked = dict.fromkeys(sorted(self.get(name)))
+        ranked.update(dict.fromkeys(sorted(self.get(name, case_insensitive=True))))
+        if self._sorted is not None:
+            ranked.update(dict.fromkeys(self.startswith(name, limit=limit)))
+        return list(ranked)[:limit]
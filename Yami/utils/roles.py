@@ -0,0 +1,41 @@
+import typing
+
+import hikari
+
+
+class RoleHierarchy:
+    """A guild's roles from highest to lowest position, with constant time rank lookups by role ID."""
+
+    def __init__(self, roles: typing.Iterable[hikari.Role]) -> None:
+        # Discord breaks position ties by ID, the older role ranking higher.
+        self.roles: typing.List[hikari.Role] = sorted(
+            roles, key=lambda role: (-role.position, role.id)
+        )
+        self.ranks: typing.Dict[hikari.Snowflake, int] = {
+            role.id: rank for rank, role in enumerate(self.roles)
+        }
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def sorted_roles(
+        self, role_ids: typing.Iterable[hikari.Snowflake]
+    ) -> typing.List[hikari.Role]:
+        """The roles among `role_ids`, highest first, looked up without scanning the whole guild."""
+        return [
+            self.roles[rank]
+            for rank in sorted(
+                self.ranks[role_id] for role_id in role_ids if role_id in self.ranks
+            )
+        ]
+
+
+async def get_role_hierarchy(bot, guild_id: hikari.Snowflake) -> RoleHierarchy:
+    """The cached hierarchy for `guild_id`, built from the role cache or REST on a miss."""
+    if (hierarchy := bot.role_hierarchies.get(guild_id)) is not None:
+        return hierarchy
+    if roles := bot.cache.get_roles_view_for_guild(guild_id).values():
+        # Only cached guilds receive the role events that keep this entry fresh.
+        hierarchy = bot.role_hierarchies[guild_id] = RoleHierarchy(roles)
+        return hierarchy
+    return RoleHierarchy(await bot.rest.fetch_roles(guild_id))
@@ -0,0 +1,194 @@
+import heapq
+import math
+import re
+import typing
+
+_WORD_REGEX: typing.Final[typing.Pattern] = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> typing.FrozenSet[str]:
+    text = f"  {text.casefold()} "
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+class TrigramIndex:
+    """Fuzzy text index scoring entities by the trigram overlap (Dice coefficient) of their best matching text."""
+
+    def __init__(self, *, max_candidates: int = 2000) -> None:
+        self.max_candidates = max_candidates
+        self._postings: typing.Dict[str, typing.Set[typing.Tuple[int, str]]] = {}
+        self._documents: typing.Dict[int, typing.Dict[str, typing.FrozenSet[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._documents
+
+    def add(self, entity_id: int, *texts: typing.Optional[str]) -> None:
+        self.remove(entity_id)
+        documents = self._documents[entity_id] = {
+            text: trigrams(text) for text in texts if text
+        }
+        for text, grams in documents.items():
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add((entity_id, text))
+
+    def remove(self, entity_id: int) -> None:
+        for text, grams in self._documents.pop(entity_id, {}).items():
+            for gram in grams:
+                postings = self._postings[gram]
+                postings.discard((entity_id, text))
+                if not postings:
+                    del self._postings[gram]
+
+    def search(
+        self, query: str, *, limit: int = 10, min_score: float = 0.0
+    ) -> typing.List[typing.Tuple[int, float]]:
+        """The `limit` best `(entity_id, score)` pairs for `query`, scores ranging from 0 to 1."""
+        query_grams = trigrams(query)
+        # Rarest trigrams first, so the candidate cap drops the least selective postings.
+        postings = sorted(
+            (self._postings[gram] for gram in query_grams if gram in self._postings),
+            key=len,
+        )
+        overlap: typing.Dict[typing.Tuple[int, str], int] = {}
+        for posting in postings:
+            for document in posting:
+                if document in overlap:
+                    overlap[document] += 1
+                elif len(overlap) < self.max_candidates:
+                    overlap[document] = 1
+        scores: typing.Dict[int, float] = {}
+        for (entity_id, text), common in overlap.items():
+            grams = self._documents[entity_id][text]
+            score = 2 * common / (len(query_grams) + len(grams))
+            if score >= min_score and score > scores.get(entity_id, 0.0):
+                scores[entity_id] = score
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+def levenshtein(first: str, second: str) -> int:
+    if len(first) < len(second):
+        first, second = second, first
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current = [i]
+        for j, second_char in enumerate(second, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (first_char != second_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree answering "words within N edits" queries without comparing against every word."""
+
+    def __init__(self, words: typing.Iterable[str] = ()) -> None:
+        self._root: typing.Optional[typing.Tuple[str, typing.Dict[int, tuple]]] = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            self._size += 1
+            return
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            if (child := node[1].get(distance)) is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return
+            node = child
+
+    def search(
+        self, word: str, max_distance: int = 2
+    ) -> typing.List[typing.Tuple[int, str]]:
+        """`(distance, word)` pairs within `max_distance` edits of `word`, closest first."""
+        if self._root is None:
+            return []
+        results = []
+        stack = [self._root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= max_distance:
+                results.append((distance, node_word))
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(results)
+
+
+def tokenize(text: str) -> typing.List[str]:
+    return _WORD_REGEX.findall(text.casefold())
+
+
+class BM25Index:
+    """Inverted index ranking documents against free text queries with Okapi BM25."""
+
+    def __init__(self, *, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: typing.Dict[str, typing.Dict[int, int]] = {}
+        self._lengths: typing.Dict[int, int] = {}
+        self._terms: typing.Dict[int, typing.FrozenSet[str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, document_id: int, *texts: typing.Optional[str]) -> None:
+        self.remove(document_id)
+        terms = [term for text in texts if text for term in tokenize(text)]
+        for term in terms:
+            posting = self._postings.setdefault(term, {})
+            posting[document_id] = posting.get(document_id, 0) + 1
+        self._lengths[document_id] = len(terms)
+        self._terms[document_id] = frozenset(terms)
+        self._total_length += len(terms)
+
+    def remove(self, document_id: int) -> None:
+        if (length := self._lengths.pop(document_id, None)) is None:
+            return
+        self._total_length -= length
+        for term in self._terms.pop(document_id):
+            posting = self._postings[term]
+            del posting[document_id]
+            if not posting:
+                del self._postings[term]
+
+    def search(
+        self, query: str, *, limit: int = 10
+    ) -> typing.List[typing.Tuple[int, float]]:
+        """The `limit` best scoring `(document_id, score)` pairs for `query`."""
+        if not self._lengths:
+            return []
+        count = len(self._lengths)
+        average_length = self._total_length / count or 1.0
+        scores: typing.Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            if (posting := self._postings.get(term)) is None:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for document_id, frequency in posting.items():
+                norm = self.k1 * (
+                    1 - self.b + self.b * self._lengths[document_id] / average_length
+                )
+                scores[document_id] = scores.get(document_id, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + norm)
+                )
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
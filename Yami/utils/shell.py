@@ -0,0 +1,128 @@
+import asyncio
+import collections
+import contextlib
+import logging
+import os
+import signal
+import tempfile
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+class OutputBuffer:
+    """Keeps the last `max_bytes` of a process' output in memory.
+
+    Once the output outgrows that, all of it is also written to a temporary file, up to `max_spill_bytes`.
+    """
+
+    def __init__(
+        self, max_bytes: int = 64 * 1024, *, max_spill_bytes: int = 8 * 1024 * 1024
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_spill_bytes = max_spill_bytes
+        self.total = 0
+        self.spilled = 0
+        self.spill: typing.Optional[typing.BinaryIO] = None
+        self._chunks: typing.Deque[bytes] = collections.deque()
+        self._size = 0
+
+    @property
+    def overflowed(self) -> bool:
+        return self.total > self.max_bytes
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > self.max_spill_bytes
+
+    def write(self, data: bytes) -> None:
+        self.total += len(data)
+        if self.spill is None and self.overflowed:
+            self.spill = tempfile.TemporaryFile()
+            for chunk in self._chunks:
+                self._write_spill(chunk)
+        if self.spill is not None:
+            self._write_spill(data)
+        self._chunks.append(data)
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            excess = self._size - self.max_bytes
+            if len(self._chunks[0]) <= excess:
+                self._size -= len(self._chunks.popleft())
+            else:
+                self._chunks[0] = self._chunks[0][excess:]
+                self._size -= excess
+
+    def _write_spill(self, data: bytes) -> None:
+        if (remaining := self.max_spill_bytes - self.spilled) > 0:
+            self.spill.write(data[:remaining])
+            self.spilled += min(len(data), remaining)
+
+    def tail(self) -> str:
+        return b"".join(self._chunks).decode(errors="replace")
+
+    def read_spill(self) -> bytes:
+        if self.spill is None:
+            return b""
+        self.spill.seek(0)
+        return self.spill.read()
+
+    def close(self) -> None:
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    with contextlib.suppress(ProcessLookupError):
+        if hasattr(os, "killpg"):
+            # The shell runs in its own session, so this also reaches the commands it started.
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+
+
+async def run_streaming(
+    command: str,
+    output: OutputBuffer,
+    *,
+    timeout: float,
+    on_update: typing.Optional[typing.Callable[[], typing.Awaitable[None]]] = None,
+    interval: float = 2.0,
+) -> typing.Optional[int]:
+    """Run shell `command`, streaming its stdout and stderr into `output` and calling `on_update` every `interval` seconds.
+
+    Returns the return code, or `None` if the command was killed after running for `timeout` seconds.
+    """
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=hasattr(os, "killpg"),
+    )
+
+    async def pump() -> int:
+        while chunk := await process.stdout.read(4096):
+            output.write(chunk)
+        return await process.wait()
+
+    async def report() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            # noinspection PyBroadException
+            try:
+                await on_update()
+            except Exception:
+                logger.warning("Failed to report shell progress", exc_info=True)
+
+    reporter = asyncio.ensure_future(report()) if on_update is not None else None
+    try:
+        return await asyncio.wait_for(pump(), timeout)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+        if process.returncode is None:
+            _kill(process)
+            await process.wait()
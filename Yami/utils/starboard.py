@@ -0,0 +1,73 @@
+import collections
+import hashlib
+import typing
+
+from Yami.utils.cache import LRUCache
+
+
+class StarCounter:
+    """Star counts per message, maintained from reaction events so the starboard never has to page through REST."""
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._counts: LRUCache[int, int] = LRUCache(maxsize)
+        self._unreconciled: "collections.OrderedDict[int, typing.Tuple[int, int]]" = (
+            collections.OrderedDict()
+        )
+        self.corrections = 0
+
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def get(self, message_id: int) -> typing.Optional[int]:
+        return self._counts.get(message_id)
+
+    def set(self, message_id: int, count: int) -> None:
+        self._counts.put(message_id, max(0, count))
+
+    def add(self, message_id: int, delta: int) -> None:
+        # Counts we never saw are seeded from the message once it is fetched.
+        if (count := self._counts.get(message_id)) is not None:
+            self.set(message_id, count + delta)
+
+    def pop(self, message_id: int) -> None:
+        self._counts.pop(message_id)
+        self._unreconciled.pop(message_id, None)
+
+    def mark(self, message_id: int, guild_id: int, channel_id: int) -> None:
+        """Queue a message to have its count re-checked against REST."""
+        self._unreconciled[message_id] = (guild_id, channel_id)
+        self._unreconciled.move_to_end(message_id)
+
+    def drain(
+        self, limit: int = 50
+    ) -> typing.List[typing.Tuple[int, typing.Tuple[int, int]]]:
+        items = []
+        while self._unreconciled and len(items) < limit:
+            items.append(self._unreconciled.popitem(last=False))
+        return items
+
+    @property
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        return {
+            **self._counts.stats,
+            "unreconciled": len(self._unreconciled),
+            "corrections": self.corrections,
+        }
+
+
+def approximate_message_size(message: typing.Any) -> int:
+    """Rough memory footprint of a cached message, dominated by its content, embeds and attachments."""
+    size = 512 + len(message.content or "")
+    size += sum(256 + len(attachment.url) for attachment in message.attachments)
+    size += sum(
+        1024 + len(embed.description or "") for embed in getattr(message, "embeds", ())
+    )
+    return size
+
+
+def render_fingerprint(*parts: typing.Any) -> str:
+    """Stable digest of the parts that make up a rendered starboard post."""
+    return hashlib.sha1("\x1f".join(map(str, parts)).encode()).hexdigest()
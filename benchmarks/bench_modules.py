@@ -0,0 +1,49 @@
+"""Compares importing every eval module up front against the lazy module namespace.
+
+Each variant runs in a fresh interpreter so modules imported by one are not cached for the other.
+Run with `python -m benchmarks.bench_modules` from the repository root.
+"""
+import statistics
+import subprocess
+import sys
+
+EAGER = (
+    "from Yami.utils.modules import EVAL_MODULES, maybe_import\n"
+    "modules = {name: maybe_import(path) for name, path in EVAL_MODULES.items()}"
+)
+LAZY = (
+    "from Yami.utils.modules import EVAL_MODULES, LazyModules\n"
+    "modules = LazyModules(EVAL_MODULES)"
+)
+MEASURE = (
+    "import resource, time\n"
+    "start = time.perf_counter()\n"
+    "{setup}\n"
+    "print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+)
+
+
+def measure(setup: str, runs: int):
+    timings, peaks = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(setup=setup)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        peaks.append(int(output[1]))
+    return statistics.median(timings), statistics.median(peaks)
+
+
+def main(runs: int = 10) -> None:
+    eager_time, eager_rss = measure(EAGER, runs)
+    lazy_time, lazy_rss = measure(LAZY, runs)
+    print(f"eager: {eager_time * 1000:8.1f}ms {eager_rss / 1024:6.1f}MiB max RSS")
+    print(f"lazy:  {lazy_time * 1000:8.1f}ms {lazy_rss / 1024:6.1f}MiB max RSS")
+    print(f"saved: {(eager_time - lazy_time) * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
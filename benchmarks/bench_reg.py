@@ -0,0 +1,52 @@
+"""Compares scan_mentions against resolving each token with resolve_id_from_arg.
+
+Run with `python -m benchmarks.bench_reg` from the repository root.
+"""
+import random
+import timeit
+
+from Yami.converters.reg import (
+    CHANNEL_MENTION_REGEX,
+    ROLE_MENTION_REGEX,
+    USER_MENTION_REGEX,
+    resolve_id_from_arg,
+    scan_mentions,
+)
+
+
+def make_message(tokens: int) -> str:
+    rng = random.Random(0)
+    choices = (
+        lambda: f"<@!{rng.randrange(10 ** 17, 10 ** 18)}>",
+        lambda: f"<#{rng.randrange(10 ** 17, 10 ** 18)}>",
+        lambda: f"<@&{rng.randrange(10 ** 17, 10 ** 18)}>",
+        lambda: str(rng.randrange(10 ** 17, 10 ** 18)),
+        lambda: "word",
+    )
+    return " ".join(rng.choice(choices)() for _ in range(tokens))
+
+
+def resolve_per_token(text: str):
+    found = []
+    for token in text.split():
+        for regex in (USER_MENTION_REGEX, CHANNEL_MENTION_REGEX, ROLE_MENTION_REGEX):
+            if (snowflake := resolve_id_from_arg(token, regex)) is not None:
+                found.append(snowflake)
+    return found
+
+
+def main():
+    for tokens in (10, 100, 1000):
+        text = make_message(tokens)
+        number = max(1, 10_000 // tokens)
+        per_token = timeit.timeit(lambda: resolve_per_token(text), number=number)
+        single_pass = timeit.timeit(lambda: scan_mentions(text), number=number)
+        print(
+            f"{tokens:>5} tokens: resolve_id_from_arg {per_token / number * 1e6:9.1f}us, "
+            f"scan_mentions {single_pass / number * 1e6:9.1f}us "
+            f"({per_token / single_pass:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from lightbulb.errors import ConverterFailure
+
+from Yami.converters.fetch import EntityFetcher
+
+
+def test_fetcher_caches_results():
+    fetcher = EntityFetcher()
+    calls = []
+
+    async def fetch_user():
+        calls.append(None)
+        return "user"
+
+    async def main():
+        await fetcher.fetch("user", 1, fetch_user)
+        return await fetcher.fetch("user", 1, fetch_user)
+
+    assert asyncio.run(main()) == "user"
+    assert len(calls) == 1
+
+
+def test_fetcher_short_circuits_remembered_misses():
+    fetcher = EntityFetcher()
+    fetcher.remember_missing("member", 1, scope=10)
+
+    async def fetch_member():
+        raise AssertionError("Known missing members must not be fetched")
+
+    with pytest.raises(ConverterFailure):
+        asyncio.run(fetcher.fetch("member", 1, fetch_member, scope=10))
+    fetcher.invalidate("member", scope=10)
+    assert not fetcher.is_missing("member", 1, scope=10)
+
+
+def test_fetcher_forgets_every_miss_in_a_scope_at_once():
+    fetcher = EntityFetcher()
+    fetcher.remember_missing("member name", "a", scope=10)
+    fetcher.remember_missing("member name", "b", scope=10)
+    fetcher.remember_missing("member name", "a", scope=20)
+    fetcher.invalidate("member name", scope=10)
+    assert not fetcher.is_missing("member name", "a", scope=10)
+    assert not fetcher.is_missing("member name", "b", scope=10)
+    assert fetcher.is_missing("member name", "a", scope=20)
+    fetcher.invalidate("member name", "a", scope=20)
+    assert not fetcher.is_missing("member name", "a", scope=20)
@@ -2,6 +2,7 @@ from hikari import Snowflake
 
 from Yami.converters.reg import (
     resolve_id_from_arg,
+    scan_mentions,
     USER_MENTION_REGEX,
     CHANNEL_MENTION_REGEX,
     ROLE_MENTION_REGEX,
@@ -43,3 +44,18 @@ def test_resolve_id_from_faulty_arg():
         resolve_id_from_arg("Hello, this is some random text.", USER_MENTION_REGEX)
         is None
     )
+
+
+def test_scan_mentions_extracts_and_dedupes_every_kind():
+    mentions = scan_mentions(
+        "<@!292577213226811392> <@292577213226811392> <#397823614092574721> "
+        "<@&265858419049758722> 265858419049758723 12345 <@&265858419049758722>"
+    )
+    assert mentions.users == (Snowflake(292577213226811392),)
+    assert mentions.channels == (Snowflake(397823614092574721),)
+    assert mentions.roles == (Snowflake(265858419049758722),)
+    assert mentions.snowflakes == (Snowflake(265858419049758723),)
+
+
+def test_scan_mentions_of_plain_text_is_empty():
+    assert scan_mentions("Hello, this is some random text.") == ((), (), (), ())
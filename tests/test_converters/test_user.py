@@ -0,0 +1,31 @@
+import types
+
+from Yami.converters.user import find_users_by_name
+from Yami.utils.names import NameIndex
+
+
+def test_find_users_by_name_filters_every_match_by_discriminator():
+    users = {
+        user_id: types.SimpleNamespace(
+            id=user_id,
+            username="bob" if user_id % 2 else "Bob",
+            discriminator=f"{user_id:04}",
+        )
+        for user_id in range(1, 61)
+    }
+    names = NameIndex(prefix_search=True)
+    for user in users.values():
+        names.add(user.id, user.username)
+    bot = types.SimpleNamespace(
+        user_names=names, cache=types.SimpleNamespace(get_user=users.get)
+    )
+
+    def find(data):
+        return find_users_by_name(
+            types.SimpleNamespace(data=data, context=types.SimpleNamespace(bot=bot))
+        )
+
+    assert len(names.search("bob")) == 25
+    assert find("bob#0059") == [users[59]]
+    assert find("bob#0060") == [users[60]]
+    assert find("bob#0061") == []
@@ -0,0 +1,15 @@
+import importlib
+import pathlib
+
+import pytest
+
+PLUGINS = sorted(
+    path.stem
+    for path in (pathlib.Path(__file__).parents[2] / "Yami" / "plugins").glob("*.py")
+)
+
+
+@pytest.mark.parametrize("name", PLUGINS)
+def test_plugin_module_imports_and_has_load(name):
+    module = importlib.import_module(f"Yami.plugins.{name}")
+    assert callable(module.load)
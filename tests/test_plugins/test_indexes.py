@@ -0,0 +1,58 @@
+import asyncio
+import types
+
+import attr
+
+from Yami.plugins.indexes import Indexes
+from Yami.utils.guild_stats import GuildStats
+from Yami.utils.names import NameIndex
+
+
+@attr.s(auto_attribs=True)
+class MemberChunkEvent:
+    """Stand-in with the field names of hikari 2.0.0.dev73's MemberChunkEvent."""
+
+    guild_id: int
+    members: dict
+    index: int
+    count: int
+
+
+def make_member(member_id, is_bot=False):
+    return types.SimpleNamespace(
+        id=member_id,
+        username=f"user{member_id}",
+        nickname=None,
+        discriminator="0001",
+        is_bot=is_bot,
+    )
+
+
+def test_member_chunks_recount_guild_stats_from_the_cache():
+    cached = {}
+    bot = types.SimpleNamespace(
+        stats_providers={},
+        member_names={1: NameIndex()},
+        member_search={},
+        user_names=NameIndex(prefix_search=True),
+        guild_stats={1: GuildStats.from_views([make_member(1)])},
+        cache=types.SimpleNamespace(get_members_view_for_guild=lambda _: cached),
+    )
+    plugin = Indexes(bot)
+    chunks = [
+        {member_id: make_member(member_id, member_id % 3 == 0) for member_id in ids}
+        for ids in (range(1, 6), range(6, 11))
+    ]
+
+    async def main():
+        for index, members in enumerate(chunks):
+            cached.update(members)
+            await plugin.on_member_chunk(
+                MemberChunkEvent(1, members, index, len(chunks))
+            )
+
+    asyncio.run(main())
+    stats = bot.guild_stats[1]
+    assert stats.members == len(cached) == 10
+    assert stats.bots == 3
+    assert bot.member_names[1].get("user10") == {10}
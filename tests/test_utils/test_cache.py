@@ -0,0 +1,51 @@
+from Yami.utils.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache(maxsize=4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_lru_cache_expires_entries(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("Yami.utils.cache.time.monotonic", lambda: now)
+    cache = LRUCache(maxsize=4, ttl=10)
+    cache.put("a", 1)
+    now = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_keeps_values_under_byte_budget():
+    cache = LRUCache(maxsize=10, sizeof=len, max_bytes=8)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.bytes == 8
+    cache.put("c", b"12")
+    assert "a" not in cache
+    assert cache.bytes == 6
+    cache.pop("b")
+    assert cache.bytes == 2
+
+
+def test_lru_cache_reports_evictions():
+    evicted = []
+    cache = LRUCache(maxsize=1, on_evict=lambda key, value: evicted.append(key))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert evicted == ["a"]
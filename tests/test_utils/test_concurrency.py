@@ -0,0 +1,134 @@
+import asyncio
+
+from Yami.utils.concurrency import (
+    Batcher,
+    Debouncer,
+    KeyedLock,
+    SingleFlight,
+    first_preferred,
+)
+
+
+def test_debouncer_coalesces_bursts():
+    calls = []
+
+    async def callback(key, items):
+        calls.append((key, items))
+
+    async def main():
+        debouncer = Debouncer(callback, delay=0.01, max_delay=1)
+        for i in range(5):
+            debouncer.schedule("message", i)
+        debouncer.schedule("other", 0)
+        await asyncio.sleep(0.05)
+        return debouncer
+
+    debouncer = asyncio.run(main())
+    assert sorted(calls) == [("message", [0, 1, 2, 3, 4]), ("other", [0])]
+    assert debouncer.merged == 4
+
+
+def test_debouncer_respects_max_delay():
+    calls = []
+
+    async def callback(key, items):
+        calls.append(items)
+
+    async def main():
+        debouncer = Debouncer(callback, delay=0.05, max_delay=0.1)
+        for i in range(8):
+            debouncer.schedule("message", i)
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+    assert len(calls) >= 2
+    assert sum(calls, []) == list(range(8))
+
+
+def test_batcher_flushes_after_window():
+    batches = []
+
+    async def callback(items):
+        batches.append(items)
+
+    async def main():
+        batcher = Batcher(callback, window=0.01)
+        batcher.add(1)
+        batcher.add(2)
+        batcher.add(2)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert batches == [{1, 2}]
+
+
+def test_keyed_lock_serializes_per_key_and_cleans_up():
+    lock = KeyedLock()
+    order = []
+
+    async def work(key, name):
+        async with lock(key):
+            order.append(f"{name} start")
+            await asyncio.sleep(0.01)
+            order.append(f"{name} end")
+
+    async def main():
+        await asyncio.gather(
+            work("a", "first"), work("a", "second"), work("b", "other")
+        )
+
+    asyncio.run(main())
+    assert order.index("first end") < order.index("second start")
+    assert order.index("other start") < order.index("first end")
+    assert len(lock) == 0
+    assert lock.stats["contended"] == 1
+
+
+def test_single_flight_shares_concurrent_calls():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return "user"
+
+    async def main():
+        return await asyncio.gather(*(flights.do(1, fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["user"] * 5
+    assert len(calls) == 1
+    assert flights.stats["deduplicated"] == 4
+    assert len(flights) == 0
+
+
+def test_first_preferred_waits_for_better_results_and_cancels_the_rest():
+    cancelled = []
+
+    async def result(value, delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return value
+
+    async def fail():
+        raise ValueError
+
+    async def main():
+        assert await first_preferred(result("hq", 0.02), result("low", 0)) == "hq"
+        assert await first_preferred(result(None, 0), result("low", 0.01)) == "low"
+        assert await first_preferred(result("hq", 0), result("low", 1)) == "hq"
+        assert await first_preferred(fail(), result("low", 0)) == "low"
+        assert await first_preferred(result(None, 0)) is None
+        try:
+            await first_preferred(fail(), result(None, 0))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected the first error to propagate")
+
+    asyncio.run(main())
+    assert cancelled == ["low"]
@@ -0,0 +1,37 @@
+import asyncio
+
+from Yami.utils.database import PoolMonitor
+
+
+class FakePool:
+    def __init__(self):
+        self.released = []
+
+    async def acquire(self, *, timeout=None):
+        await asyncio.sleep(0)
+        return object()
+
+    async def release(self, connection, *, timeout=None):
+        self.released.append(connection)
+
+    def get_size(self):
+        return 2
+
+
+def test_pool_monitor_tracks_acquire_and_release():
+    pool = FakePool()
+    monitor = PoolMonitor(pool, acquire_timeout=1)
+
+    async def main():
+        connection = await pool.acquire()
+        assert monitor.stats["in use"] == 1
+        await pool.release(connection)
+        async with pool.acquire():
+            assert monitor.stats["idle"] == 1
+
+    asyncio.run(main())
+    stats = monitor.stats
+    assert stats["acquisitions"] == 2
+    assert stats["in use"] == 0
+    assert stats["acquire <=1ms"] == 2
+    assert len(pool.released) == 2
@@ -0,0 +1,37 @@
+import types
+
+from Yami.utils.guild_stats import GuildStats
+
+
+def test_guild_stats_counts_views():
+    stats = GuildStats.from_views(
+        [types.SimpleNamespace(is_bot=flag) for flag in (False, False, True)],
+        [types.SimpleNamespace(type=kind) for kind in ("text", "text", "voice")],
+        range(4),
+        range(2),
+    )
+    assert (stats.members, stats.humans, stats.bots) == (3, 2, 1)
+    assert stats.channels == {"text": 2, "voice": 1}
+    assert stats.channel_count == 3
+    assert (stats.roles, stats.emojis) == (4, 2)
+
+
+def test_guild_stats_updates_incrementally():
+    stats = GuildStats()
+    stats.add_member(True)
+    stats.add_member(False)
+    stats.remove_member(True)
+    assert (stats.members, stats.bots) == (1, 0)
+    stats.add_channel("category")
+    stats.remove_channel("category")
+    stats.remove_channel("category")
+    assert stats.channels["category"] == 0
+    assert stats.channel_count == 0
+
+
+def test_guild_stats_recounts_members():
+    stats = GuildStats()
+    stats.add_member(True)
+    stats.add_member(True)
+    stats.count_members([types.SimpleNamespace(is_bot=flag) for flag in (False, True)])
+    assert (stats.members, stats.humans, stats.bots) == (2, 1, 1)
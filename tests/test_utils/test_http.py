@@ -0,0 +1,65 @@
+import asyncio
+
+from aiohttp import web
+
+from Yami.utils.http import HTTPClient
+
+
+async def serve(handler):
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    # noinspection PyProtectedMember
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+def test_http_client_reuses_connections_and_records_latency():
+    async def handler(_):
+        return web.Response(body=b"ok")
+
+    async def main():
+        runner, url = await serve(handler)
+        client = HTTPClient()
+        try:
+            for _ in range(3):
+                async with client.request("GET", url) as response:
+                    assert await response.read() == b"ok"
+        finally:
+            await client.close()
+            await runner.cleanup()
+        return client
+
+    client = asyncio.run(main())
+    assert client.hosts["127.0.0.1"]["requests"] == 3
+    assert client.hosts["127.0.0.1"]["connections created"] == 1
+    assert client.hosts["127.0.0.1"]["connections reused"] == 2
+    assert client.stats["127.0.0.1 connection reuse"] == "67%"
+
+
+def test_http_client_retries_retryable_statuses():
+    calls = []
+
+    async def handler(_):
+        calls.append(None)
+        return web.Response(status=503 if len(calls) < 3 else 200)
+
+    async def main():
+        runner, url = await serve(handler)
+        client = HTTPClient(retries=2, backoff=0)
+        try:
+            async with client.request("GET", url) as response:
+                assert response.status == 200
+            async with client.request("GET", url, retries=0) as response:
+                assert response.status == 200
+        finally:
+            await client.close()
+            await runner.cleanup()
+        return client
+
+    client = asyncio.run(main())
+    assert len(calls) == 4
+    assert client.retried == 2
@@ -0,0 +1,55 @@
+import asyncio
+
+from aiohttp import web
+
+from Yami.utils.http import HTTPClient
+from Yami.utils.media import CachedMedia, MediaCache
+
+
+def test_media_cache_revalidates_stale_entries_with_etag():
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        if request.path == "/missing":
+            return web.Response(status=404)
+        return web.Response(body=b"jpeg", headers={"ETag": '"v1"'})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/{name}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        # noinspection PyProtectedMember
+        url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        client, cache = HTTPClient(), MediaCache(max_age=60)
+        try:
+            first = await cache.fetch(client, "key", f"{url}/image")
+            assert await cache.fetch(client, "key", f"{url}/image") is first
+            cache.max_age = 0
+            await asyncio.sleep(0.01)
+            second = await cache.fetch(client, "key", f"{url}/image")
+            assert second.data is first.data
+            assert await cache.fetch(client, "other", f"{url}/missing") is None
+        finally:
+            await client.close()
+            await runner.cleanup()
+        return cache
+
+    cache = asyncio.run(main())
+    assert requests == [None, '"v1"', None]
+    assert (cache.downloaded, cache.revalidated) == (1, 1)
+
+
+def test_media_cache_spills_evicted_entries_to_disk(tmp_path):
+    cache = MediaCache(max_bytes=4, spill_dir=tmp_path)
+    cache.memory.put("a", CachedMedia(b"1234", '"a"', None, 0.0))
+    cache.memory.put("b", CachedMedia(b"5678", None, None, 0.0))
+    assert "a" not in cache.memory
+    assert cache.spilled == 1
+    assert cache.get("a") == CachedMedia(b"1234", '"a"', None, 0.0)
+    assert cache.get("missing") is None
@@ -0,0 +1,22 @@
+from Yami.utils.modules import LazyModules, referenced_names
+
+
+def test_referenced_names_includes_nested_functions():
+    code = compile(
+        "async def __invoke__(bot, context):\n    return json.dumps(math.pi)",
+        "<eval>",
+        "exec",
+    )
+    assert {"json", "dumps", "math", "pi"} <= referenced_names(code)
+
+
+def test_lazy_modules_import_on_first_lookup_only():
+    modules = LazyModules({"json": "json", "missing": "yami_missing_module"})
+    assert "json" in modules and not modules.loaded
+    assert modules.resolve(["json", "missing", "print"]) == {
+        "json": __import__("json"),
+        "missing": None,
+    }
+    assert set(modules.load_times) == {"json", "missing"}
+    assert modules.stats["loaded"] == 2
+    assert modules.stats["missing import"].endswith("(missing)")
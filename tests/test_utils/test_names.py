@@ -0,0 +1,33 @@
+from Yami.utils.names import NameIndex
+
+
+def test_name_index_looks_up_exact_and_case_insensitive_names():
+    index = NameIndex()
+    index.add(1, "Forbidden", "Yami")
+    index.add(2, "forbidden", None)
+    assert index.get("Forbidden") == {1}
+    assert index.get("FORBIDDEN", case_insensitive=True) == {1, 2}
+    assert index.get("yami", case_insensitive=True) == {1}
+
+
+def test_name_index_replaces_and_removes_names():
+    index = NameIndex()
+    index.add(1, "old", "nick")
+    index.add(1, "new", None)
+    assert index.get("old") == frozenset()
+    assert index.get("new") == {1}
+    index.remove(1)
+    assert index.get("new") == frozenset()
+    assert len(index) == 0
+
+
+def test_name_index_ranks_exact_then_folded_then_prefix_matches():
+    index = NameIndex(prefix_search=True)
+    index.add(1, "yamibot")
+    index.add(2, "yami")
+    index.add(3, "Yami")
+    index.add(4, "other")
+    assert index.search("Yami") == [3, 2, 1]
+    assert index.startswith("YA") == [2, 3, 1]
+    index.remove(1)
+    assert index.startswith("yamib") == []
@@ -0,0 +1,19 @@
+import types
+
+from Yami.utils.roles import RoleHierarchy
+
+
+def role(role_id, position):
+    return types.SimpleNamespace(id=role_id, position=position)
+
+
+def test_role_hierarchy_orders_by_position_then_id():
+    hierarchy = RoleHierarchy([role(1, 0), role(3, 2), role(2, 2), role(4, 1)])
+    assert [r.id for r in hierarchy.roles] == [2, 3, 4, 1]
+    assert hierarchy.ranks == {2: 0, 3: 1, 4: 2, 1: 3}
+
+
+def test_role_hierarchy_sorts_member_roles_and_skips_unknown_ids():
+    hierarchy = RoleHierarchy([role(1, 0), role(2, 5), role(3, 3)])
+    assert [r.id for r in hierarchy.sorted_roles([3, 99, 2])] == [2, 3]
+    assert hierarchy.sorted_roles([]) == []
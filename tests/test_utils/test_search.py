@@ -0,0 +1,60 @@
+from Yami.utils.search import BKTree, BM25Index, TrigramIndex, tokenize
+
+
+def test_trigram_index_ranks_closest_names_first():
+    index = TrigramIndex()
+    index.add(1, "Forbidden", "Forbidden#0001")
+    index.add(2, "Forest")
+    index.add(3, "Yami", "Yami#1234")
+    results = index.search("forbiden")
+    assert [entity_id for entity_id, _ in results][:2] == [1, 2]
+    assert 0 < results[0][1] <= 1
+    assert index.search("yami#1234")[0] == (3, 1.0)
+
+
+def test_trigram_index_forgets_removed_entities():
+    index = TrigramIndex()
+    index.add(1, "Forbidden")
+    index.add(1, "Yami")
+    assert index.search("Forbidden") == []
+    index.remove(1)
+    assert index.search("Yami") == []
+    assert len(index) == 0
+
+
+def test_bk_tree_finds_words_within_distance():
+    tree = BKTree(["help", "inspect", "info", "settings", "setprefix", "shell"])
+    assert tree.search("hlep", max_distance=2) == [(2, "help")]
+    assert tree.search("inf", max_distance=1) == [(1, "info")]
+    assert tree.search("zzzzzz", max_distance=1) == []
+    assert len(tree) == 6
+
+
+def test_tokenize_splits_on_punctuation_and_underscores():
+    assert tokenize("Set the star_board, NOW!") == [
+        "set",
+        "the",
+        "star",
+        "board",
+        "now",
+    ]
+
+
+def test_bm25_index_ranks_rarer_and_denser_matches_higher():
+    index = BM25Index()
+    index.add(1, "starboard", "Sets the starboard channel for the guild")
+    index.add(2, "settings", "Shows the guild settings")
+    index.add(3, "inspect member", "Shows information about a member of the guild")
+    assert [doc for doc, _ in index.search("starboard channel")] == [1]
+    assert [doc for doc, _ in index.search("shows guild")][:2] == [2, 3]
+    assert index.search("nothing") == []
+
+
+def test_bm25_index_replaces_and_removes_documents():
+    index = BM25Index()
+    index.add(1, "old text")
+    index.add(1, "new text")
+    assert index.search("old") == []
+    index.remove(1)
+    assert index.search("text") == []
+    assert len(index) == 0
@@ -0,0 +1,43 @@
+import asyncio
+
+from Yami.utils.shell import OutputBuffer, run_streaming
+
+
+def test_output_buffer_keeps_tail_and_spills_overflow():
+    output = OutputBuffer(8, max_spill_bytes=12)
+    output.write(b"12345")
+    assert not output.overflowed and output.spill is None
+    output.write(b"67890")
+    output.write(b"abc")
+    assert output.tail() == "67890abc"
+    assert output.read_spill() == b"1234567890ab"
+    assert output.overflowed and output.truncated
+    output.close()
+
+
+def test_run_streaming_reports_progress_and_return_code():
+    updates = []
+    output = OutputBuffer()
+
+    async def on_update():
+        updates.append(output.tail())
+
+    code = asyncio.run(
+        run_streaming(
+            "echo out; echo err >&2; sleep 0.3; exit 3",
+            output,
+            timeout=5,
+            on_update=on_update,
+            interval=0.1,
+        )
+    )
+    assert code == 3
+    assert output.tail() == "out\nerr\n"
+    assert updates and updates[-1] == "out\nerr\n"
+
+
+def test_run_streaming_kills_commands_after_timeout():
+    output = OutputBuffer()
+    code = asyncio.run(run_streaming("echo start; sleep 5", output, timeout=0.3))
+    assert code is None
+    assert output.tail() == "start\n"
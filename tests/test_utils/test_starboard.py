@@ -0,0 +1,21 @@
+from Yami.utils.starboard import StarCounter
+
+
+def test_star_counter_ignores_deltas_for_unseeded_messages():
+    counter = StarCounter()
+    counter.add(1, 1)
+    assert counter.get(1) is None
+    counter.set(1, 4)
+    counter.add(1, 1)
+    counter.add(1, -6)
+    assert counter.get(1) == 0
+
+
+def test_star_counter_drains_unreconciled_in_order():
+    counter = StarCounter()
+    counter.mark(1, 10, 100)
+    counter.mark(2, 10, 100)
+    counter.mark(1, 10, 100)
+    assert counter.drain(limit=1) == [(2, (10, 100))]
+    assert counter.drain() == [(1, (10, 100))]
+    assert counter.drain() == []